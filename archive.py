@@ -0,0 +1,171 @@
+import json
+import os
+
+import numpy as np
+
+# --- ARQUIVO DE TEMPORADAS ENCERRADAS ---
+# Na virada de ano o calendário é descartado; antes disso os jogos da temporada (placares) e
+# os gols (quem marcou, em qual jogo) vão para um arquivo compacto por temporada:
+#   MAGIC (8 bytes) | tamanho do cabeçalho (uint32) | cabeçalho JSON | jogos | gols
+# Jogos e gols são registros de tamanho fixo (dtypes abaixo), lidos com memmap. Em memória fica
+# só o índice (cabeçalho de cada temporada); as consultas mapeiam apenas as temporadas pedidas.
+# Times e jogadores são referenciados pelos ids da Engine.
+
+MAGIC = b"UNIFUTA1"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+FIXTURE_DTYPE = np.dtype([
+    ("id", np.int32), ("week", np.int16), ("competition", np.int16),
+    ("home", np.int32), ("away", np.int32), ("home_score", np.int16), ("away_score", np.int16),
+])
+
+GOAL_DTYPE = np.dtype([("match", np.int32), ("team", np.int32), ("player", np.int32)])
+
+# Resultado das consultas: o jogo arquivado com o ano da temporada
+RESULT_DTYPE = np.dtype([("year", np.int16)] + FIXTURE_DTYPE.descr)
+
+
+def _align(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+class SeasonArchive:
+    """Arquivo em disco das temporadas encerradas de uma carreira (um arquivo por ano)"""
+    def __init__(self, directory):
+        self.directory = directory
+        self.index = {} # ano -> cabeçalho (contagens, offsets, competições, times)
+        if os.path.isdir(directory):
+            for fname in sorted(os.listdir(directory)):
+                if fname.startswith("season_") and fname.endswith(".arc"):
+                    header = self._read_header(os.path.join(directory, fname))
+                    self.index[header["year"]] = header
+
+    @property
+    def years(self):
+        return sorted(self.index)
+
+    def path(self, year):
+        return os.path.join(self.directory, f"season_{year}.arc")
+
+    # --- GRAVAÇÃO ---
+
+    def flush_season(self, year, matches, goals):
+        """
+        Grava a temporada `year`.
+        matches: jogos do calendário (só os disputados entram); goals: (id do jogo, id do time, id do jogador).
+        """
+        played = [m for m in matches if m.played]
+        competitions = sorted({m.competition for m in played})
+        comp_code = {c: i for i, c in enumerate(competitions)}
+
+        fixtures = np.empty(len(played), dtype=FIXTURE_DTYPE)
+        for field, values in (
+            ("id", [m.id for m in played]), ("week", [m.week for m in played]),
+            ("competition", [comp_code[m.competition] for m in played]),
+            ("home", [m.home_team.id for m in played]), ("away", [m.away_team.id for m in played]),
+            ("home_score", [m.home_score for m in played]), ("away_score", [m.away_score for m in played]),
+        ):
+            fixtures[field] = values
+        goal_arr = np.array(list(goals), dtype=GOAL_DTYPE) if goals else np.empty(0, dtype=GOAL_DTYPE)
+
+        header = {
+            "version": FORMAT_VERSION, "year": year, "competitions": competitions,
+            "teams": np.union1d(fixtures["home"], fixtures["away"]).tolist(),
+            "fixtures": len(fixtures), "goals": len(goal_arr),
+        }
+        # Offsets dependem do tamanho do próprio cabeçalho: reserva espaço para eles e reescreve
+        header["fixtures_offset"] = header["goals_offset"] = 0
+        blob = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        fixtures_offset = _align(len(MAGIC) + 4 + len(blob) + 64)
+        header["fixtures_offset"] = fixtures_offset
+        header["goals_offset"] = _align(fixtures_offset + fixtures.nbytes)
+        blob = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(year)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(np.uint32(len(blob)).tobytes())
+            f.write(blob)
+            f.write(b"\0" * (fixtures_offset - f.tell()))
+            f.write(fixtures.tobytes())
+            f.write(b"\0" * (header["goals_offset"] - f.tell()))
+            f.write(goal_arr.tobytes())
+        os.replace(tmp, path) # Temporada gravada pela metade nunca entra no índice
+        header["path"] = path
+        header["teams"] = set(header["teams"])
+        self.index[year] = header
+        return header
+
+    def drop_season(self, year):
+        """Apaga a temporada do disco e do índice (desfazer a virada de ano)"""
+        header = self.index.pop(year, None)
+        if header is not None and os.path.exists(header["path"]):
+            os.remove(header["path"])
+
+    @staticmethod
+    def _read_header(path):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} não é um arquivo de temporada da UniFUT")
+            size = int(np.frombuffer(f.read(4), dtype=np.uint32)[0])
+            header = json.loads(f.read(size).decode("utf-8"))
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Versão de arquivo não suportada: {header['version']}")
+        header["path"] = path
+        header["teams"] = set(header["teams"])
+        return header
+
+    # --- LEITURA (MEMMAP POR TEMPORADA) ---
+
+    def fixtures(self, year):
+        h = self.index[year]
+        if not h["fixtures"]: return np.empty(0, dtype=FIXTURE_DTYPE)
+        return np.memmap(h["path"], dtype=FIXTURE_DTYPE, mode="r", offset=h["fixtures_offset"], shape=(h["fixtures"],))
+
+    def goals(self, year):
+        h = self.index[year]
+        if not h["goals"]: return np.empty(0, dtype=GOAL_DTYPE)
+        return np.memmap(h["path"], dtype=GOAL_DTYPE, mode="r", offset=h["goals_offset"], shape=(h["goals"],))
+
+    def competition(self, year, code):
+        return self.index[year]["competitions"][code]
+
+    def _select(self, years, team_ids, mask_fn):
+        """Jogos (com o ano) das temporadas pedidas que passam no filtro, do mais antigo ao mais recente"""
+        parts = []
+        for year in (self.years if years is None else [y for y in years if y in self.index]):
+            # O índice diz quais times jogaram: temporadas sem eles nem são mapeadas
+            if not all(t in self.index[year]["teams"] for t in team_ids): continue
+            fx = self.fixtures(year)
+            rows = fx[mask_fn(fx)]
+            out = np.empty(len(rows), dtype=RESULT_DTYPE)
+            out["year"] = year
+            for name in FIXTURE_DTYPE.names: out[name] = rows[name]
+            parts.append(out)
+        return np.concatenate(parts) if parts else np.empty(0, dtype=RESULT_DTYPE)
+
+    def head_to_head(self, team_a, team_b, years=None):
+        """Todos os jogos arquivados entre dois times (ids), em qualquer mando"""
+        return self._select(years, (team_a, team_b), lambda fx:
+                            ((fx["home"] == team_a) & (fx["away"] == team_b)) |
+                            ((fx["home"] == team_b) & (fx["away"] == team_a)))
+
+    def team_results(self, team_id, years=None):
+        return self._select(years, (team_id,), lambda fx: (fx["home"] == team_id) | (fx["away"] == team_id))
+
+    def match_goals(self, year, match_id):
+        """(id do time, id do jogador) de cada gol do jogo, na ordem em que foram sorteados"""
+        g = self.goals(year)
+        rows = g[g["match"] == match_id]
+        return list(zip(rows["team"].tolist(), rows["player"].tolist()))
+
+    def top_scorers(self, year, n=10):
+        """[(id do jogador, gols)] dos artilheiros da temporada (jogos com estatística)"""
+        g = self.goals(year)
+        if not len(g): return []
+        ids, counts = np.unique(g["player"], return_counts=True)
+        order = np.argsort(-counts, kind="stable")[:n]
+        return list(zip(ids[order].tolist(), counts[order].tolist()))
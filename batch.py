@@ -0,0 +1,166 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from universe import build_universe
+
+# --- SIMULAÇÃO EM LOTE (SEM UI) ---
+#   python batch.py --seeds 1-200 --seasons 20 --workers 8 --out noite/lote.csv
+# Cada carreira (uma semente) roda num processo do pool: monta o universo a partir do teams_db.json
+# e avança temporadas inteiras pela Engine (calendário, advance_week, janela de transferências,
+# virada de ano). O processo devolve só arrays pequenos por temporada: campeões, distribuição de
+# gols por jogo e caixa/receita de cada clube no fim do ano.
+# Saída .csv: três arquivos (<nome>_champions/_goals/_finances.csv) gravados conforme as carreiras
+# terminam. Saída .npz: um arquivo com tudo empilhado por carreira, gravado no final.
+
+MAX_MATCH_GOALS = 10 # Última faixa do histograma de gols por jogo (10 ou mais)
+
+
+def run_career(seed, seasons, db_path="teams_db.json"):
+    """Uma carreira inteira; roda dentro do processo do pool"""
+    start = time.perf_counter()
+    engine = build_universe(db_path, seed=seed)
+    engine.checkpoints = None # Em lote não há semana para desfazer
+    n = len(engine.teams)
+    goals = np.zeros((seasons, MAX_MATCH_GOALS + 1), dtype=np.int64)
+    budgets = np.zeros((seasons, n), dtype=np.int64)
+    revenues = np.zeros((seasons, n), dtype=np.int64)
+    closed = 0
+
+    def close_season(engine):
+        # Semana 52 já jogada e acertada; a virada ainda não zerou calendário e receita
+        nonlocal closed
+        played = [m for m in engine.calendar.matches if m.played]
+        total = np.fromiter((m.home_score + m.away_score for m in played), dtype=np.int64, count=len(played))
+        goals[closed] = np.bincount(np.minimum(total, MAX_MATCH_GOALS), minlength=MAX_MATCH_GOALS + 1)
+        budgets[closed] = [t.budget for t in engine.teams]
+        revenues[closed] = [t.revenue for t in engine.teams]
+        closed += 1
+
+    engine.on_season_end = close_season
+    engine.fast_forward(seasons)
+
+    h = engine.history
+    return {
+        "seed": seed,
+        "elapsed": time.perf_counter() - start,
+        "weeks": seasons * 52,
+        "year": h.seasons["year"].copy(),
+        "lnf": h.seasons["lnf"].copy(),
+        "ncp": h.seasons["ncp"].copy(),
+        "copa": h.seasons["copa"].copy(),
+        "top_scorer": [h.names.get(pid, "") for pid in h.seasons["top_scorer"].tolist()],
+        "top_goals": h.seasons["top_goals"].copy(),
+        "goals": goals,
+        "budget": budgets,
+        "revenue": revenues,
+        "teams": [t.name for t in engine.teams],
+        "leagues": [t.league for t in engine.teams],
+    }
+
+
+class CSVSink:
+    """Três CSVs em formato longo, uma linha por (carreira, temporada[, time])"""
+    def __init__(self, path):
+        base = os.path.splitext(path)[0]
+        self.paths = [f"{base}_{kind}.csv" for kind in ("champions", "goals", "finances")]
+        self.files = [open(p, "w", newline="", encoding="utf-8") for p in self.paths]
+        self.champions, self.goals, self.finances = (csv.writer(f) for f in self.files)
+        self.champions.writerow(["seed", "year", "lnf", "ncp", "copa", "top_scorer", "top_goals"])
+        self.goals.writerow(["seed", "year"] + [f"g{k}" for k in range(MAX_MATCH_GOALS)] + [f"g{MAX_MATCH_GOALS}+"])
+        self.finances.writerow(["seed", "year", "team", "league", "budget", "revenue"])
+
+    def write(self, r):
+        name = lambda tid: r["teams"][tid] if tid >= 0 else ""
+        for i, year in enumerate(r["year"].tolist()):
+            self.champions.writerow([r["seed"], year, name(int(r["lnf"][i])), name(int(r["ncp"][i])),
+                                     name(int(r["copa"][i])), r["top_scorer"][i], int(r["top_goals"][i])])
+            self.goals.writerow([r["seed"], year] + r["goals"][i].tolist())
+            self.finances.writerows([r["seed"], year, team, league, budget, revenue] for team, league, budget, revenue
+                                    in zip(r["teams"], r["leagues"], r["budget"][i].tolist(), r["revenue"][i].tolist()))
+        for f in self.files: f.flush()
+
+    def close(self):
+        for f in self.files: f.close()
+        return self.paths
+
+
+class NPZSink:
+    """Arrays (carreira, temporada[, time]) num único .npz, na ordem das sementes"""
+    def __init__(self, path):
+        self.path = path
+        self.results = []
+
+    def write(self, r):
+        self.results.append(r)
+
+    def close(self):
+        rs = sorted(self.results, key=lambda r: r["seed"])
+        arrays = {"seed": np.array([r["seed"] for r in rs])}
+        for key in ("year", "lnf", "ncp", "copa", "top_goals", "goals", "budget", "revenue"):
+            arrays[key] = np.stack([r[key] for r in rs]) if rs else np.empty(0)
+        arrays["top_scorer"] = np.array([r["top_scorer"] for r in rs])
+        if rs:
+            arrays["teams"] = np.array(rs[0]["teams"])
+            arrays["leagues"] = np.array(rs[0]["leagues"])
+        np.savez_compressed(self.path, **arrays)
+        return [self.path]
+
+
+def parse_seeds(text):
+    """'1-200' (intervalo inclusivo), '1,5,9' ou uma mistura: '1-10,50'"""
+    seeds = []
+    for part in text.split(","):
+        lo, _, hi = part.strip().partition("-")
+        seeds.extend(range(int(lo), int(hi) + 1) if hi else [int(lo)])
+    return seeds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simula carreiras inteiras da UniFUT sem a interface.")
+    parser.add_argument("--seeds", default="1-10", help="sementes: '1-200', '1,5,9' ou '1-10,50' (padrão: 1-10)")
+    parser.add_argument("--seasons", type=int, default=20, help="temporadas por carreira (padrão: 20)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processos no pool (padrão: nº de CPUs)")
+    parser.add_argument("--db", default="teams_db.json", help="banco de times do College")
+    parser.add_argument("--out", default="batch.csv", help="saída .csv (três arquivos) ou .npz")
+    args = parser.parse_args(argv)
+
+    seeds = parse_seeds(args.seeds)
+    if args.seasons < 1 or not seeds:
+        parser.error("é preciso ao menos uma semente e uma temporada")
+    if not os.path.exists(args.db):
+        parser.error(f"banco de times não encontrado: {args.db}")
+    out_dir = os.path.dirname(args.out)
+    if out_dir: os.makedirs(out_dir, exist_ok=True)
+    sink = NPZSink(args.out) if args.out.endswith(".npz") else CSVSink(args.out)
+
+    workers = max(1, min(args.workers or 1, len(seeds)))
+    print(f"UniFUT em lote: {len(seeds)} carreira(s) x {args.seasons} temporada(s), {workers} processo(s)", file=sys.stderr)
+    start = time.perf_counter()
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_career, seed, args.seasons, args.db): seed for seed in seeds}
+        for future in as_completed(futures):
+            r = future.result()
+            sink.write(r)
+            done += 1
+            wall = time.perf_counter() - start
+            print(f"[{done:>{len(str(len(seeds)))}}/{len(seeds)}] seed {r['seed']}: {r['elapsed']:.1f}s | "
+                  f"{done * args.seasons / wall:.1f} temporadas/s no lote", file=sys.stderr)
+
+    wall = time.perf_counter() - start
+    paths = sink.close()
+    seasons = len(seeds) * args.seasons
+    print(f"Concluído em {wall:.1f}s: {seasons} temporadas ({seasons / wall:.2f}/s, {seasons * 52 / wall:.0f} semanas/s, "
+          f"{len(seeds) / wall * 60:.1f} carreiras/min)", file=sys.stderr)
+    for p in paths: print(p)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
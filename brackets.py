@@ -0,0 +1,312 @@
+import numpy as np
+
+# --- MOTOR DE CHAVEAMENTO (COPAS E PLAYOFFS) ---
+# Um Bracket é só a descrição das rodadas: quem entra, quantos folgam e como se formam os pares.
+# O mesmo desenho serve para:
+#   - rodar a competição de verdade (Bracket.run / BracketState, com stats dos jogadores);
+#   - projetar chances de avanço com milhares de simulações vetorizadas (Bracket.run_many).
+#
+# Regras de emparelhamento (`pairing`):
+#   "fold"     -> reordena por seed a cada rodada: melhor x pior restante (estilo NFL)
+#   "slots"    -> chave fixa: posição i x posição n-1-i (folgados primeiro, depois vencedores na ordem dos jogos)
+#   "adjacent" -> 1º x 2º, 3º x 4º... na ordem atual
+#   "draw"     -> sorteio puro e depois "adjacent" (número ímpar: o último sorteado folga)
+# O primeiro time de cada par é o mandante.
+
+PAIRINGS = ("fold", "slots", "adjacent", "draw")
+
+
+class Round:
+    def __init__(self, name, pairing="slots", byes=0, joins=None, tie_labels=None, no_byes=None):
+        if pairing not in PAIRINGS:
+            raise ValueError(f"Emparelhamento desconhecido: {pairing}")
+        self.name = name
+        self.pairing = pairing
+        self.byes = byes             # Os `byes` melhores seeds folgam nesta rodada
+        self.joins = joins           # Chave de um grupo de times que entra nesta rodada
+        self.no_byes = no_byes       # Chave de um grupo que nunca folga nesta rodada (ex: quem acabou de entrar)
+        self.tie_labels = tie_labels # Nome de cada jogo (ex: Bowls), na ordem dos pares
+
+
+class TieResult:
+    def __init__(self, home, away, home_goals, away_goals, label=None):
+        self.home = home
+        self.away = away
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.label = label
+
+    @property
+    def winner(self):
+        return self.home if self.home_goals > self.away_goals else self.away
+
+    def __repr__(self):
+        return f"{self.home.name} {self.home_goals} x {self.away_goals} {self.away.name}"
+
+
+class RoundResult:
+    def __init__(self, name, ties, byes):
+        self.name = name
+        self.ties = ties # list[TieResult]
+        self.byes = byes # Times que folgaram
+
+
+def _arrange(rnd, slots, seed_of, random_keys=None, groups=None):
+    """
+    Monta os pares de uma rodada para várias simulações ao mesmo tempo.
+    slots: (n_sims, k) índices dos participantes vivos, na ordem da chave.
+    groups: índices de cada grupo de entrada (para `no_byes`).
+    Retorna (mandantes, visitantes, folgados) como arrays (n_sims, ...).
+    """
+    n_sims, k = slots.shape
+    byes = min(rnd.byes, k)
+
+    if byes:
+        rank = seed_of[slots]
+        if rnd.no_byes is not None:
+            # O grupo vai para o fim da fila das folgas (só folga se não houver mais ninguém)
+            rank = rank + np.isin(slots, groups[rnd.no_byes]) * len(seed_of)
+        order = np.argsort(rank, axis=1, kind="stable")
+        ranked = np.take_along_axis(slots, order, axis=1)
+        bye_cols = ranked[:, :byes]
+        # Quem joga mantém a ordem da chave
+        keep = np.sort(order[:, byes:], axis=1)
+        playing = np.take_along_axis(slots, keep, axis=1)
+    else:
+        bye_cols = slots[:, :0]
+        playing = slots
+
+    if rnd.pairing == "fold":
+        order = np.argsort(seed_of[playing], axis=1, kind="stable")
+        playing = np.take_along_axis(playing, order, axis=1)
+    elif rnd.pairing == "draw":
+        order = np.argsort(random_keys(playing.shape), axis=1)
+        playing = np.take_along_axis(playing, order, axis=1)
+
+    n = playing.shape[1]
+    if n % 2:
+        # Número ímpar: o último da ordem (sorteio ou chave) folga
+        bye_cols = np.concatenate([bye_cols, playing[:, -1:]], axis=1)
+        playing = playing[:, :-1]
+        n -= 1
+
+    if rnd.pairing in ("fold", "slots"):
+        home, away = playing[:, :n // 2], playing[:, n // 2:][:, ::-1]
+    else:
+        home, away = playing[:, 0::2], playing[:, 1::2]
+    return home, away, bye_cols
+
+
+class BracketState:
+    """Chave em andamento, rodada a rodada (usada pelos playoffs agendados no calendário)"""
+    def __init__(self, bracket, teams, seed_of, joins, random_keys):
+        self.bracket = bracket
+        self.teams = teams
+        self.seed_of = seed_of
+        self.joins = joins
+        self.random_keys = random_keys
+        self.round_idx = 0
+        self.slots = joins[None][None, :]
+        self.pending = None
+        self.results = []
+
+    @property
+    def finished(self):
+        return self.round_idx >= len(self.bracket.rounds)
+
+    @property
+    def current_round(self):
+        return self.bracket.rounds[self.round_idx]
+
+    @property
+    def champion(self):
+        return self.teams[self.slots[0, 0]] if self.finished else None
+
+    def seed(self, team):
+        return int(self.seed_of[self.teams.index(team)]) + 1
+
+    def next_ties(self):
+        """Pares (mandante, visitante) da rodada atual"""
+        rnd = self.current_round
+        if rnd.joins is not None:
+            self.slots = np.concatenate([self.slots, self.joins[rnd.joins][None, :]], axis=1)
+        home, away, byes = _arrange(rnd, self.slots, self.seed_of, self.random_keys, self.joins)
+        self.pending = (home[0], away[0], byes[0])
+        return [(self.teams[h], self.teams[a]) for h, a in zip(home[0].tolist(), away[0].tolist())]
+
+    def advance(self, scores):
+        """Registra os placares (na ordem de next_ties) e passa para a próxima rodada"""
+        home, away, byes = self.pending
+        rnd = self.current_round
+        labels = rnd.tie_labels or [None] * len(home)
+        ties = [TieResult(self.teams[h], self.teams[a], int(g1), int(g2), labels[i])
+                for i, (h, a, (g1, g2)) in enumerate(zip(home.tolist(), away.tolist(), scores))]
+        winners = np.where([g1 > g2 for g1, g2 in scores], home, away)
+        self.results.append(RoundResult(rnd.name, ties, [self.teams[b] for b in byes.tolist()]))
+        self.slots = np.concatenate([byes, winners])[None, :]
+        self.pending = None
+        self.round_idx += 1
+        return self.results[-1]
+
+    # --- SAVE (times por id; a chave é achada pelo nome em BRACKETS) ---
+
+    def to_dict(self):
+        return {
+            "bracket": self.bracket.name,
+            "teams": [t.id for t in self.teams],
+            "seed_of": self.seed_of.tolist(),
+            "joins": {"" if key is None else key: idx.tolist() for key, idx in self.joins.items()},
+            "round_idx": self.round_idx,
+            "slots": self.slots.tolist(),
+            "pending": None if self.pending is None else [a.tolist() for a in self.pending],
+            "results": [{"name": r.name, "byes": [t.id for t in r.byes],
+                         "ties": [[t.home.id, t.away.id, t.home_goals, t.away_goals, t.label] for t in r.ties]}
+                        for r in self.results],
+        }
+
+    @classmethod
+    def from_dict(cls, data, engine):
+        teams = [engine.teams[i] for i in data["teams"]]
+        joins = {None if key == "" else key: np.asarray(idx, dtype=np.int64) for key, idx in data["joins"].items()}
+        state = cls(BRACKETS[data["bracket"]], teams, np.asarray(data["seed_of"], dtype=np.int64), joins,
+                    _random_keys(engine))
+        state.round_idx = data["round_idx"]
+        state.slots = np.asarray(data["slots"], dtype=np.int64).reshape(1, -1)
+        if data["pending"] is not None:
+            state.pending = tuple(np.asarray(a, dtype=np.int64) for a in data["pending"])
+        for r in data["results"]:
+            ties = [TieResult(engine.teams[h], engine.teams[a], g1, g2, label) for h, a, g1, g2, label in r["ties"]]
+            state.results.append(RoundResult(r["name"], ties, [engine.teams[i] for i in r["byes"]]))
+        return state
+
+
+def _random_keys(engine):
+    """Chaves do sorteio de pares ("draw"), tiradas do gerador da Engine"""
+    return lambda shape: engine.rng.random_many(shape)
+
+
+class Bracket:
+    def __init__(self, name, rounds):
+        self.name = name
+        self.rounds = rounds
+
+    def _index(self, entrants, joins, seed_order):
+        """Numera os participantes e calcula o seed (0 = melhor) de cada um"""
+        groups = {None: list(entrants)}
+        groups.update(joins or {})
+        teams = [t for g in groups.values() for t in g]
+        ids = {id(t): i for i, t in enumerate(teams)}
+        if seed_order is None: seed_order = teams
+        seed_of = np.full(len(teams), len(teams), dtype=np.int64)
+        rank = 0
+        for t in seed_order:
+            i = ids.get(id(t))
+            if i is not None and seed_of[i] == len(teams):
+                seed_of[i] = rank
+                rank += 1
+        index_groups = {}
+        start = 0
+        for key, g in groups.items():
+            index_groups[key] = np.arange(start, start + len(g))
+            start += len(g)
+        return teams, seed_of, index_groups
+
+    def start(self, engine, entrants, joins=None, seed_order=None):
+        """
+        Abre a chave. `entrants` começam na 1ª rodada; `joins` = {chave: [times]} para quem
+        entra em rodadas posteriores. Seeds seguem `seed_order` (padrão: ordem de entrada).
+        """
+        teams, seed_of, groups = self._index(entrants, joins, seed_order)
+        return BracketState(self, teams, seed_of, groups, _random_keys(engine))
+
+    def run(self, engine, entrants, joins=None, seed_order=None, with_stats=True):
+        """Disputa a competição inteira; cada rodada é simulada em um lote só"""
+        state = self.start(engine, entrants, joins, seed_order)
+        while not state.finished:
+            pairs = state.next_ties()
+            state.advance(engine.simulate_ties(pairs, is_knockout=True, with_stats=with_stats))
+        return state
+
+    def run_many(self, engine, entrants, n_sims=5000, joins=None, seed_order=None, advance=None, gen=None):
+        """
+        Monte Carlo: roda a chave `n_sims` vezes em paralelo (arrays n_sims x jogos).
+        Retorna BracketOdds com probs[i, r] = chance do time i passar da rodada r
+        (a última coluna é a chance de título) e o campeão de cada simulação.
+        `advance` (matriz já calculada, na ordem dos participantes) e `gen` permitem rodar
+        sobre uma cópia do estado, fora do lock da Engine.
+        """
+        teams, seed_of, groups = self._index(entrants, joins, seed_order)
+        # Chance exata de cada mandante eliminar cada visitante (tabela do match_model)
+        if advance is None: advance = engine.knockout_matrix(teams)
+        if gen is None: gen = engine.rng.generator
+
+        slots = np.tile(groups[None], (n_sims, 1))
+        advanced = np.zeros((len(teams), len(self.rounds)))
+        for r, rnd in enumerate(self.rounds):
+            if rnd.joins is not None:
+                slots = np.concatenate([slots, np.tile(groups[rnd.joins], (n_sims, 1))], axis=1)
+            home, away, byes = _arrange(rnd, slots, seed_of, gen.random, groups)
+
+            home_wins = gen.random(home.shape) < advance[home, away]
+
+            winners = np.where(home_wins, home, away)
+            slots = np.concatenate([byes, winners], axis=1)
+            advanced[:, r] = np.bincount(slots.ravel(), minlength=len(teams))
+
+        return BracketOdds(teams, advanced / n_sims, slots[:, 0])
+
+
+class BracketOdds:
+    def __init__(self, teams, probs, champions):
+        self.teams = teams         # Participantes (índices usados em probs/champions)
+        self.probs = probs         # (n_times, n_rodadas)
+        self.champions = champions # (n_sims,) índice do campeão em cada simulação
+
+    def title_odds(self):
+        return {t: p for t, p in zip(self.teams, self.probs[:, -1].tolist())}
+
+
+# --- CHAVES DAS COMPETIÇÕES ---
+
+# Copa do Brasil (Manual pg. 45/46): College 2 abre, College 1 entra na Fase 2, LNF na Fase 3
+# (todos os clubes LNF que entram jogam; as 24 folgas vão para os melhores seeds do College
+# ainda vivos, que estreiam na Fase 4) e os 8 seeds LNF só nas Oitavas.
+COPA_DO_BRASIL = Bracket("Copa do Brasil", [
+    Round("Fase 1 (Preliminar College)", pairing="draw"),
+    Round("Fase 2 (Geral College)", pairing="draw", joins="college"),
+    Round("Fase 3 (Entrada LNF)", pairing="draw", joins="lnf", byes=24, no_byes="lnf"),
+    Round("Fase 4", pairing="draw"),
+    Round("Fase 5", pairing="draw"),
+    Round("Fase 6", pairing="draw"),
+    Round("Oitavas de Final", pairing="draw", joins="seeds"),
+    Round("Quartas de Final", pairing="draw"),
+    Round("Semifinal", pairing="draw"),
+    Round("Grande Final", pairing="draw"),
+])
+
+# Bowls Regionais: campeões de conferência em jogo único (entrada já na ordem dos confrontos)
+REGIONAL_BOWLS = Bracket("Bowls Regionais", [
+    Round("Bowls", pairing="adjacent",
+          tie_labels=["North Star Bowl", "Caldeirão Bowl", "Coffee Bowl", "Oceanic Bowl"]),
+])
+
+# National College Playoff (Manual Seção 6): 12 times, seeds 1-4 folgam na 1ª rodada
+NCP = Bracket("National College Playoff", [
+    Round("🏁 RODADA 1 (Wild Card College)", pairing="slots", byes=4),
+    Round("🥣 QUARTAS DE FINAL (Bowls Temáticos)", pairing="slots",
+          tie_labels=["Heritage Bowl", "Prime Bowl", "Leadership Bowl", "New Horizons Bowl"]),
+    Round("🏆 SEMIFINAIS NACIONAIS", pairing="slots"),
+    Round("🎆 NATIONAL CHAMPIONSHIP GAME", pairing="slots"),
+])
+
+# Playoffs LNF por conferência: 7 classificados, seed 1 folga no Wild Card, reseed a cada rodada
+LNF_CONFERENCE_PLAYOFFS = Bracket("Playoffs LNF", [
+    Round("Wild Card", pairing="fold", byes=1),
+    Round("Divisional", pairing="fold"),
+    Round("Final de Conferência", pairing="fold"),
+])
+
+LNF_SUPER_BOWL = Bracket("Super Bowl", [Round("Super Bowl", pairing="slots")])
+
+# Chaves pelo nome (para reabrir uma BracketState salva)
+BRACKETS = {b.name: b for b in (COPA_DO_BRASIL, REGIONAL_BOWLS, NCP, LNF_CONFERENCE_PLAYOFFS, LNF_SUPER_BOWL)}
@@ -0,0 +1,235 @@
+import argparse
+import itertools
+import sys
+import time
+
+import numpy as np
+
+from match_model import (AVG_GOALS, HOME_ADVANTAGE, TACTIC_BONUS, ELO_SCALE, GOAL_FLOOR, NEUTRAL_TACTIC,
+                         goal_expectations, effective_diff)
+
+# --- CALIBRAGEM DO MODELO DE PARTIDA ---
+#   python calibration.py --matches 5000000
+#   python calibration.py --search avg_goals=2.0:3.0:0.25 home_advantage=0,5,10,20 --top 10
+# Joga milhões de partidas de uma vez com a mesma conta do simulate_match (diferença efetiva ->
+# Elo -> duas Poisson), sem times nem Engine: os confrontos saem de uma grade de ratings
+# (pares com no máximo `max_gap` de diferença, como nos jogos dentro de uma liga) e as táticas
+# são sorteadas entre os 4 estilos de técnico, como no generate_coaches.
+# O relatório compara gols por jogo, mandante/empate/visitante e zebras com as metas (TARGETS).
+# A busca em grade reaproveita os mesmos confrontos e a mesma semente para todas as combinações
+# (números aleatórios comuns), então a diferença entre elas é das constantes, não do sorteio.
+
+PARAMS = {
+    "avg_goals": AVG_GOALS,
+    "home_advantage": HOME_ADVANTAGE,
+    "tactic_bonus": TACTIC_BONUS,
+    "elo_scale": ELO_SCALE,
+    "goal_floor": GOAL_FLOOR,
+}
+
+# Metas de referência (ligas nacionais de primeira divisão); ajustáveis por --target
+TARGETS = {
+    "goals": 2.7,   # Gols por jogo (soma dos dois lados)
+    "home": 0.45,   # Vitórias do mandante
+    "draw": 0.26,
+    "away": 0.29,
+    "upset": 0.25,  # Favorito (>= UPSET_GAP de rating) derrotado
+}
+METRICS = tuple(TARGETS)
+
+UPSET_GAP = 8            # Diferença de rating (sem mando/tática) que define o favorito
+RATING_RANGE = (50, 95)  # Da College 2 mais fraca à elite da LNF
+MAX_GAP = 20             # Maior diferença de rating entre os dois lados de um confronto
+GAP_BUCKET = 5           # Largura das faixas de diferença no relatório detalhado
+CHUNK = 1_000_000        # Jogos por lote vetorizado (memória limitada mesmo com dezenas de milhões)
+
+
+def rating_grid(lo=RATING_RANGE[0], hi=RATING_RANGE[1], max_gap=MAX_GAP):
+    """Pares (mandante, visitante) de ratings inteiros com |diferença| <= max_gap"""
+    ratings = np.arange(lo, hi + 1)
+    a, b = np.meshgrid(ratings, ratings, indexing="ij")
+    keep = np.abs(a - b) <= max_gap
+    return a[keep].astype(float), b[keep].astype(float)
+
+
+class Tally:
+    """Somas acumuladas lote a lote; as taxas só são calculadas no fim"""
+    def __init__(self, max_gap=MAX_GAP):
+        self.n = 0
+        self.goals = 0
+        self.home = 0
+        self.draw = 0
+        self.away = 0
+        self.favourites = 0
+        self.upsets = 0
+        # Detalhe por faixa de diferença de rating (mandante - visitante)
+        self.edges = np.arange(-max_gap, max_gap + GAP_BUCKET, GAP_BUCKET)
+        n_buckets = len(self.edges) + 1
+        self.bucket_n = np.zeros(n_buckets, dtype=np.int64)
+        self.bucket_home = np.zeros(n_buckets, dtype=np.int64)
+        self.bucket_draw = np.zeros(n_buckets, dtype=np.int64)
+
+    def add(self, gap, goals_a, goals_b):
+        home, draw = goals_a > goals_b, goals_a == goals_b
+        away = goals_a < goals_b
+        self.n += len(gap)
+        self.goals += int(goals_a.sum() + goals_b.sum())
+        self.home += int(home.sum())
+        self.draw += int(draw.sum())
+        self.away += int(away.sum())
+        fav_home, fav_away = gap >= UPSET_GAP, gap <= -UPSET_GAP
+        self.favourites += int(fav_home.sum() + fav_away.sum())
+        self.upsets += int((fav_home & away).sum() + (fav_away & home).sum())
+
+        bucket = np.digitize(gap, self.edges)
+        size = len(self.bucket_n)
+        self.bucket_n += np.bincount(bucket, minlength=size)
+        self.bucket_home += np.bincount(bucket, weights=home, minlength=size).astype(np.int64)
+        self.bucket_draw += np.bincount(bucket, weights=draw, minlength=size).astype(np.int64)
+
+    def metrics(self):
+        n = max(self.n, 1)
+        return {
+            "goals": self.goals / n,
+            "home": self.home / n,
+            "draw": self.draw / n,
+            "away": self.away / n,
+            "upset": self.upsets / max(self.favourites, 1),
+        }
+
+    def buckets(self):
+        """(rótulo da faixa, jogos, mandante, empate, visitante) para as faixas com jogos"""
+        labels = [f"< {self.edges[0]}"] + [f"{lo:+d}..{hi - 1:+d}" for lo, hi in zip(self.edges[:-1], self.edges[1:])]
+        labels.append(f">= {self.edges[-1]:+d}")
+        rows = []
+        for label, n, home, draw in zip(labels, self.bucket_n.tolist(), self.bucket_home.tolist(), self.bucket_draw.tolist()):
+            if n: rows.append((label, n, home / n, draw / n, (n - home - draw) / n))
+        return rows
+
+
+def simulate(params, matches, seed=0, grid=None, tactics=True, max_gap=MAX_GAP):
+    """
+    Joga `matches` partidas com as constantes `params` e devolve o Tally.
+    Confrontos e gols usam geradores separados: com a mesma semente, combinações diferentes de
+    constantes enfrentam exatamente os mesmos confrontos.
+    """
+    p = {**PARAMS, **params}
+    grid_a, grid_b = grid if grid is not None else rating_grid(max_gap=max_gap)
+    fixtures_gen, goals_gen = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(2))
+    tally = Tally(max_gap)
+    left = matches
+    while left > 0:
+        size = min(left, CHUNK)
+        left -= size
+        cell = fixtures_gen.integers(0, len(grid_a), size)
+        strength_a, strength_b = grid_a[cell], grid_b[cell]
+        if tactics:
+            code_a, code_b = fixtures_gen.integers(0, NEUTRAL_TACTIC + 1, (2, size))
+        else:
+            code_a = code_b = np.full(size, NEUTRAL_TACTIC)
+        diff = effective_diff(strength_a, strength_b, code_a, code_b,
+                              home_advantage=p["home_advantage"], tactic_bonus=p["tactic_bonus"])
+        lam_a, lam_b = goal_expectations(diff, p["avg_goals"], p["elo_scale"], p["goal_floor"])
+        tally.add(strength_a - strength_b, goals_gen.poisson(lam_a), goals_gen.poisson(lam_b))
+    return tally
+
+
+def loss(metrics, targets=TARGETS):
+    """Soma dos erros relativos ao quadrado (cada métrica pesa igual, qualquer que seja a escala)"""
+    return sum(((metrics[k] - t) / t) ** 2 for k, t in targets.items())
+
+
+def grid_search(space, matches, seed=0, targets=TARGETS, tactics=True, max_gap=MAX_GAP):
+    """Todas as combinações de `space` ({constante: [valores]}); lista (perda, params, métricas) da melhor à pior"""
+    grid = rating_grid(max_gap=max_gap)
+    names = list(space)
+    results = []
+    for values in itertools.product(*(space[k] for k in names)):
+        params = dict(zip(names, values))
+        metrics = simulate(params, matches, seed, grid, tactics, max_gap).metrics()
+        results.append((loss(metrics, targets), params, metrics))
+    results.sort(key=lambda r: r[0])
+    return results
+
+
+def parse_values(text):
+    """'2.0:3.0:0.25' (intervalo inclusivo com passo) ou '0,5,10'"""
+    if ":" in text:
+        lo, hi, step = (float(x) for x in text.split(":"))
+        return np.round(np.arange(lo, hi + step / 2, step), 6).tolist()
+    return [float(x) for x in text.split(",")]
+
+
+def parse_assignments(items, allowed, parse):
+    """['nome=valor', ...] -> dict, recusando nomes fora de `allowed`"""
+    out = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep or name not in allowed:
+            raise ValueError(f"esperado nome=valor com nome em {', '.join(allowed)}: {item!r}")
+        out[name] = parse(value)
+    return out
+
+
+def format_metrics(metrics, targets):
+    return " | ".join(f"{k} {metrics[k]:.3f}" + (f" ({metrics[k] - targets[k]:+.3f})" if k in targets else "")
+                      for k in METRICS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibra as constantes do modelo de partida da UniFUT.")
+    parser.add_argument("--matches", type=int, default=2_000_000, help="jogos simulados no relatório (padrão: 2.000.000)")
+    parser.add_argument("--seed", type=int, default=0, help="semente dos confrontos e dos gols")
+    parser.add_argument("--max-gap", type=int, default=MAX_GAP, help=f"maior diferença de rating num confronto (padrão: {MAX_GAP})")
+    parser.add_argument("--no-tactics", action="store_true", help="todos os técnicos neutros (sem duelo tático)")
+    parser.add_argument("--set", nargs="*", default=[], metavar="NOME=VALOR", help="troca constantes do relatório")
+    parser.add_argument("--target", nargs="*", default=[], metavar="MÉTRICA=VALOR", help="troca metas (goals, home, draw, away, upset)")
+    parser.add_argument("--search", nargs="*", default=[], metavar="NOME=VALORES",
+                        help="busca em grade: avg_goals=2.0:3.0:0.25 home_advantage=0,5,10")
+    parser.add_argument("--search-matches", type=int, default=200_000, help="jogos por combinação na busca (padrão: 200.000)")
+    parser.add_argument("--top", type=int, default=5, help="melhores combinações exibidas (padrão: 5)")
+    args = parser.parse_args(argv)
+
+    try:
+        params = {**PARAMS, **parse_assignments(args.set, PARAMS, float)}
+        targets = {**TARGETS, **parse_assignments(args.target, TARGETS, float)}
+        space = parse_assignments(args.search, PARAMS, parse_values)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.matches < 1 or args.search_matches < 1:
+        parser.error("é preciso simular ao menos um jogo")
+    tactics = not args.no_tactics
+
+    start = time.perf_counter()
+    tally = simulate(params, args.matches, args.seed, tactics=tactics, max_gap=args.max_gap)
+    wall = time.perf_counter() - start
+    metrics = tally.metrics()
+    print("Constantes: " + ", ".join(f"{k}={v:g}" for k, v in params.items()))
+    print(f"{tally.n:,} jogos em {wall:.2f}s ({tally.n / wall / 1e6:.1f}M jogos/s)")
+    print(f"{'métrica':<8} {'simulado':>9} {'meta':>7} {'desvio':>8}")
+    for k in METRICS:
+        print(f"{k:<8} {metrics[k]:>9.3f} {targets[k]:>7.3f} {metrics[k] - targets[k]:>+8.3f}")
+    print(f"perda {loss(metrics, targets):.4f} (zebra = favorito por {UPSET_GAP}+ de rating derrotado)")
+    print()
+    print(f"{'diferença':<10} {'jogos':>10} {'mandante':>9} {'empate':>7} {'visitante':>10}")
+    for label, n, home, draw, away in tally.buckets():
+        print(f"{label:<10} {n:>10,} {home:>9.3f} {draw:>7.3f} {away:>10.3f}")
+
+    if space:
+        combos = int(np.prod([len(v) for v in space.values()]))
+        print()
+        print(f"Busca em grade: {combos} combinação(ões) x {args.search_matches:,} jogos", file=sys.stderr)
+        start = time.perf_counter()
+        fixed = {k: v for k, v in params.items() if k not in space}
+        results = grid_search({**{k: [v] for k, v in fixed.items()}, **space}, args.search_matches,
+                              args.seed, targets, tactics, args.max_gap)
+        wall = time.perf_counter() - start
+        print(f"Concluída em {wall:.1f}s ({combos * args.search_matches / wall / 1e6:.1f}M jogos/s)", file=sys.stderr)
+        for rank, (value, combo, m) in enumerate(results[:args.top], 1):
+            chosen = ", ".join(f"{k}={combo[k]:g}" for k in space)
+            print(f"{rank:>2}. perda {value:.4f} | {chosen} | {format_metrics(m, targets)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import random
+from collections import deque
+from operator import attrgetter
+
+import numpy as np
+
+from history import SeasonHistory
+
+# --- CHECKPOINTS SEMANAIS (DESFAZER SEMANA) ---
+# No começo de cada semana (ver UniFUTEngine.roll_scenarios) a Engine grava um Checkpoint barato:
+#   - escalares da carreira, estado dos geradores (random, np.random e o VariatePool);
+#   - colunas dos times (tabela, caixa, instalações), placares dos jogos da semana;
+#   - tamanhos dos registros append-only (livro-caixa, gols, calendário, jogadores);
+#   - um diário do que muda nos jogadores durante a semana (gols/jogos creditados, elencos e
+#     overall mexidos por cenários, elencos e contratos mexidos pelo Draft), preenchido pela Engine via _note.
+# Desfazer aplica o diário de trás pra frente e corta os registros: o custo acompanha o que a
+# semana mudou, não o tamanho do universo. A virada de ano (semana 52) mexe em todos os jogadores:
+# o checkpoint dela guarda também atributos e elencos de todo mundo, o calendário e o histórico.
+# O anel guarda só as últimas `depth` semanas, então a memória fica limitada.
+
+DEFAULT_DEPTH = 8
+
+TEAM_FIELDS = ("wins", "losses", "draws", "points", "goals_for", "goals_against", "budget", "revenue",
+               "salary_cap", "stadium_level", "training_level", "youth_level")
+PLAYER_FIELDS = ("age", "_overall", "potential", "contract_years", "market_value", "_wage",
+                 "goals", "assists", "matches", "mvp_points", "last_evolution")
+MATCH_FIELDS = ("played", "home_score", "away_score", "_narrative", "fidelity")
+
+# Entradas do diário: (CREDIT, autores dos gols, titulares), (ROSTER, time, Team.snapshot_squad()),
+# (OVERALL, jogador, overall antes, potencial antes), (CONTRACT, jogador, anos de contrato antes)
+CREDIT, ROSTER, OVERALL, CONTRACT = range(4)
+
+
+class Checkpoint:
+    __slots__ = ("year", "week", "scalars", "rng_states", "teams", "tactics", "matches", "sizes",
+                 "playoffs", "playoff_matches", "journal", "season")
+
+    def __init__(self, engine):
+        e = engine
+        self.year, self.week = e.season_year, e.current_week
+        self.scalars = (e.lnf_champion, dict(e.cup_champions), e.last_transfer_log, e.last_draft, e.last_bowls,
+                        e._scenarios_rolled, list(e.scenario_queue), list(e._scenario_logs))
+        self.rng_states = (random.getstate(), np.random.get_state(), e.rng.get_state())
+        self.teams = list(map(attrgetter(*TEAM_FIELDS), e.teams))
+        self.tactics = [(t.formation, t.next_tactic) for t in e.teams]
+        self.matches = [(m, attrgetter(*MATCH_FIELDS)(m)) for m in e.calendar.get_matches_for_week(e.current_week)]
+        self.sizes = (len(e.ledger), len(e.goal_events), len(e.calendar.matches), len(e.players))
+        # Chaves em andamento: só a posição de cada uma (os arrays são trocados, nunca alterados)
+        self.playoffs = [(key, state, state.round_idx, state.slots, state.pending, len(state.results))
+                         for key, state in e.lnf_playoffs.items()]
+        self.playoff_matches = {k: list(v) for k, v in e._playoff_matches.items()}
+        self.journal = []
+        self.season = _SeasonSnapshot(e) if e.current_week == 52 else None
+
+    def restore(self, engine):
+        e = engine
+        for entry in reversed(self.journal):
+            if entry[0] == CREDIT:
+                for p in entry[1]: p.goals -= 1
+                for p in entry[2]: p.matches -= 1
+            elif entry[0] == ROSTER:
+                entry[1].restore_squad(entry[2])
+            elif entry[0] == CONTRACT:
+                entry[1].contract_years = entry[2]
+            else:
+                entry[1].overall, entry[1].potential = entry[2], entry[3]
+        if self.season is not None:
+            self.season.restore(e, self.year)
+
+        n_ledger, n_goals, n_matches, n_players = self.sizes
+        e.ledger.truncate(n_ledger)
+        del e.goal_events[n_goals:]
+        e.calendar.truncate(n_matches)
+        del e.players[n_players:]
+        for m, values in self.matches:
+            for field, value in zip(MATCH_FIELDS, values): setattr(m, field, value)
+
+        for t, row, (formation, tactic) in zip(e.teams, self.teams, self.tactics):
+            for field, value in zip(TEAM_FIELDS, row): setattr(t, field, value)
+            if t.formation != formation: t.formation = formation
+            t.next_tactic = tactic
+
+        for key, state, round_idx, slots, pending, n_results in self.playoffs:
+            state.round_idx, state.slots, state.pending = round_idx, slots, pending
+            del state.results[n_results:]
+        e.lnf_playoffs = {key: state for key, state, *_ in self.playoffs}
+        e._playoff_matches = {k: list(v) for k, v in self.playoff_matches.items()}
+
+        (e.lnf_champion, cups, e.last_transfer_log, e.last_draft, e.last_bowls, e._scenarios_rolled, queue,
+         logs) = self.scalars
+        e.cup_champions = dict(cups)
+        e.scenario_queue, e._scenario_logs = list(queue), list(logs)
+        e.season_year, e.current_week = self.year, self.week
+        py_state, np_state, pool_state = self.rng_states
+        random.setstate(py_state)
+        np.random.set_state(np_state)
+        e.rng.set_state(pool_state)
+
+
+class _SeasonSnapshot:
+    """Parte pesada do checkpoint da semana 52: o que a virada de ano refaz no universo inteiro"""
+    __slots__ = ("rosters", "players", "values", "calendar", "goal_events", "history", "names", "archived")
+
+    def __init__(self, e):
+        self.rosters = [list(t.players) for t in e.teams]
+        self.players = [p for roster in self.rosters for p in roster]
+        self.values = list(map(attrgetter(*PLAYER_FIELDS), self.players))
+        self.calendar = e.calendar
+        self.goal_events = e.goal_events
+        self.history = e.history.to_arrays()
+        self.names = dict(e.history.names)
+        self.archived = e.archive is not None and e.season_year in e.archive.index
+
+    def restore(self, e, year):
+        # Atributos direto nos slots; a folha e a força são refeitas pelo setter do elenco
+        for p, values in zip(self.players, self.values):
+            for field, value in zip(PLAYER_FIELDS, values): setattr(p, field, value)
+        # Solta todo mundo antes: com a janela de transferências, o elenco atual de um time tem
+        # jogadores que voltam para outro
+        for t in e.teams: t.players = []
+        for t, roster in zip(e.teams, self.rosters):
+            t.players = list(roster)
+        e.calendar = self.calendar
+        e.goal_events = self.goal_events
+        e.history = SeasonHistory.from_arrays(self.history, self.names)
+        if e.archive is not None and not self.archived:
+            e.archive.drop_season(year) # Gravada na virada que está sendo desfeita
+
+
+class CheckpointRing:
+    """As últimas `depth` semanas (a mais recente no fim)"""
+    def __init__(self, depth=DEFAULT_DEPTH):
+        self.ring = deque(maxlen=depth)
+
+    def __len__(self):
+        return len(self.ring)
+
+    @property
+    def depth(self):
+        return self.ring.maxlen
+
+    def record(self, engine):
+        cp = Checkpoint(engine)
+        self.ring.append(cp)
+        return cp
+
+    def latest_weeks(self):
+        """(ano, semana) de cada checkpoint, do mais recente para o mais antigo"""
+        return [(cp.year, cp.week) for cp in reversed(self.ring)]
+
+    def rewind(self, engine, n=1):
+        """Volta `n` semanas (desfaz da mais recente para a mais antiga). Retorna o checkpoint final."""
+        if not 1 <= n <= len(self.ring):
+            raise ValueError(f"Só há {len(self.ring)} semana(s) para desfazer")
+        for _ in range(n):
+            cp = self.ring.pop()
+            cp.restore(engine)
+        return cp
+
+    def clear(self):
+        self.ring.clear()
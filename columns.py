@@ -0,0 +1,47 @@
+import numpy as np
+
+# --- COLUNAS TIPADAS QUE CRESCEM ---
+# Base dos registros append-only (histórico, livro-caixa): cada campo é um array numpy com
+# folga, dobrado quando enche, e as leituras são fatias sem cópia.
+
+
+class Columns:
+    """Colunas numpy que crescem por duplicação (append amortizado O(1))"""
+    def __init__(self, dtypes):
+        self.dtypes = dtypes
+        self._data = {k: np.empty(16, dtype=dt) for k, dt in dtypes.items()}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name):
+        return self._data[name][:self.size]
+
+    def extend(self, **cols):
+        n = len(next(iter(cols.values())))
+        if self.size + n > len(self._data[next(iter(self.dtypes))]):
+            cap = max(16, 2 * (self.size + n))
+            for k, arr in self._data.items():
+                grown = np.empty(cap, dtype=arr.dtype)
+                grown[:self.size] = arr[:self.size]
+                self._data[k] = grown
+        for k in self.dtypes:
+            self._data[k][self.size:self.size + n] = cols[k]
+        self.size += n
+
+    def append(self, **row):
+        self.extend(**{k: [v] for k, v in row.items()})
+
+    def truncate(self, size):
+        """Descarta as linhas a partir de `size` (a capacidade fica)"""
+        self.size = min(self.size, size)
+
+
+def grow(arr, size):
+    """Array de contagem com pelo menos `size` posições (completa com zeros)"""
+    if size <= arr.shape[-1]: return arr
+    shape = arr.shape[:-1] + (max(size, 2 * arr.shape[-1]),)
+    grown = np.zeros(shape, dtype=arr.dtype)
+    grown[..., :arr.shape[-1]] = arr
+    return grown
@@ -0,0 +1,110 @@
+import heapq
+
+import numpy as np
+
+from strength import STARTER_SLOTS
+from valuation import market_values
+
+# --- DRAFT UNIFUT (SEMANA 48) ---
+# Os prospectos são os jogadores do College até MAX_PROSPECT_AGE. Cada um recebe um valor
+# projetado (valor de mercado do overall que deve atingir no auge) calculado em lote, e entra
+# em dois heaps: o geral e o da posição dele. Escolher é olhar o topo (descartando quem já foi
+# escolhido, remoção preguiçosa) e marcar o id: O(log n) por escolha, sem reordenar o pool.
+# A ordem é a inversa da tabela da LNF (o pior escolhe primeiro), a mesma nas 7 rodadas.
+# A Engine move os jogadores escolha a escolha (a política de cada clube enxerga o elenco
+# já reforçado) e acerta as taxas do Manual (Seção 10.9) de uma vez no fim.
+
+ROUNDS = 7
+DRAFT_FEES = (1_000_000, 600_000, 350_000, 200_000, 100_000, 50_000, 25_000) # Por rodada, LNF -> College
+
+MAX_PROSPECT_AGE = 23  # Idade limite para entrar no pool
+PEAK_AGE = 27          # Idade de referência do valor projetado (faixa do auge)
+GROWTH_YEARS = 6       # Quem tem MAX_PROSPECT_AGE - GROWTH_YEARS anos ou menos conta com todo o potencial
+ROOKIE_CONTRACT = 4    # Anos do contrato de novato
+ROSTER_LIMIT = 28      # Elenco máximo da LNF depois do Draft (mesmo limite dos free agents)
+
+# Política "necessidade": a posição mais fraca do XI está NEED_GAP abaixo da média do time.
+# Mesmo assim, o melhor disponível leva se valer NEED_MARGIN vezes o melhor da posição.
+NEED_GAP = 3
+NEED_MARGIN = 1.5
+BPA, NEED = "Melhor disponível", "Necessidade"
+
+
+def projected_overalls(overall, potential, age):
+    """Overall esperado no auge: quanto mais jovem, mais do potencial entra na conta"""
+    overall = np.asarray(overall, dtype=float)
+    weight = np.clip((MAX_PROSPECT_AGE + 1 - np.asarray(age)) / GROWTH_YEARS, 0, 1)
+    return np.rint(overall + (np.asarray(potential) - overall).clip(0) * weight).astype(np.int64)
+
+
+def projected_values(players):
+    """Valor projetado de cada jogador (mesma ordem da lista)"""
+    n = len(players)
+    def column(attr):
+        return np.fromiter((getattr(p, attr) for p in players), dtype=np.int64, count=n)
+    projection = projected_overalls(column("overall"), column("potential"), column("age"))
+    return market_values(projection, np.full(n, PEAK_AGE))
+
+
+def draft_order(lnf_teams):
+    """Pior campanha primeiro (Pts, V, SG), critério inverso da classificação"""
+    return sorted(lnf_teams, key=lambda t: (t.points, t.wins, t.goal_diff))
+
+
+class ProspectPool:
+    """Prospectos indexados por valor projetado: um heap geral e um por posição"""
+    def __init__(self, players):
+        self.players = {p.id: p for p in players}
+        self.values = dict(zip(self.players, projected_values(list(self.players.values())).tolist()))
+        self._all = [(-v, pid) for pid, v in self.values.items()]
+        self._by_pos = {pos: [] for pos in STARTER_SLOTS}
+        for entry in self._all:
+            self._by_pos[self.players[entry[1]].position].append(entry)
+        heapq.heapify(self._all)
+        for heap in self._by_pos.values(): heapq.heapify(heap)
+        self._taken = set()
+
+    def __len__(self):
+        return len(self.players) - len(self._taken)
+
+    def best(self, position=None):
+        """Melhor prospecto ainda disponível (no geral ou na posição), sem tirá-lo do pool"""
+        heap = self._all if position is None else self._by_pos[position]
+        while heap and heap[0][1] in self._taken:
+            heapq.heappop(heap)
+        return self.players[heap[0][1]] if heap else None
+
+    def take(self, player):
+        self._taken.add(player.id)
+
+    def ranking(self, n=None):
+        """Disponíveis do mais ao menos valioso (para exibição; não mexe nos heaps)"""
+        rows = [(self.players[pid], -key) for key, pid in sorted(self._all) if pid not in self._taken]
+        return rows if n is None else rows[:n]
+
+
+def pick_policy(team):
+    """Necessidade se a posição mais fraca do XI destoa do time; senão, melhor disponível"""
+    weakest = min(STARTER_SLOTS, key=team.position_strength)
+    return NEED if team.position_strength(weakest) < team.strength - NEED_GAP else BPA
+
+
+def choose_pick(pool, team):
+    """(jogador, política) da escolha do clube; None se o pool acabou"""
+    best = pool.best()
+    if best is None: return None
+    policy = pick_policy(team)
+    if policy == NEED:
+        target = pool.best(min(STARTER_SLOTS, key=team.position_strength))
+        if target is not None and pool.values[best.id] < NEED_MARGIN * pool.values[target.id]:
+            return target, policy
+    return best, BPA
+
+
+def surplus(team, limit=ROSTER_LIMIT):
+    """Quem sai para o elenco voltar ao limite: reservas de menor valor projetado"""
+    extra = len(team.players) - limit
+    if extra <= 0: return []
+    bench = [p for p in team.players if not team.lineup.is_starter(p)]
+    order = np.argsort(projected_values(bench), kind="stable")[:extra]
+    return [bench[i] for i in order.tolist()]
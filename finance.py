@@ -0,0 +1,55 @@
+import numpy as np
+
+# --- ACERTO FINANCEIRO SEMANAL (VETORIZADO) ---
+# Uma vez por semana, para todos os clubes de uma vez: bilheteria dos jogos em casa, salários
+# (folha anual / 52), manutenção das instalações e a parcela semanal dos direitos de TV.
+# As funções recebem arrays com uma posição por time (ou por jogo, na bilheteria); a Engine
+# monta as colunas, soma tudo e lança no livro-caixa em lote (ver UniFUTEngine._settle_week).
+
+WEEKS_PER_YEAR = 52
+
+# Bilheteria: nível do estádio * base * fator sorteado em [0.8, 1.5); LNF tem torcida maior (x4)
+TICKET_BASE = 100_000
+TICKET_LOW, TICKET_HIGH = 0.8, 1.5
+LNF_CROWD = 4
+
+# Parte da folha de referência (Player.wage) que sai do caixa a cada semana. Calibrado para o
+# clube médio da LNF fechar o ano perto do zero com TV + bilheteria (o resto da folha é coberto
+# por patrocínio/direitos de imagem). No College os atletas são bolsistas: sem salário, como já
+# era antes do acerto semanal (só a LNF tinha folha descontada, no antigo distribute_tv_rights).
+# Cobrar a folha cheia no College quebraria todos: a de um College 1 passa de R$ 100M/ano,
+# contra caixa de R$ 25-45M e teto salarial de R$ 40M.
+WAGE_SHARE = {"LNF": 0.5, "College 1": 0.0, "College 2": 0.0}
+
+# Manutenção semanal de cada instalação: base * nível^2 (estádio, CT e base)
+UPKEEP_BASE = 500
+
+# Direitos de TV da LNF (Manual Pg. 223): pool anual 50% igualitário, 25% por pontos,
+# 25% por audiência (rating como proxy de torcida), pago em parcelas semanais
+TV_POOL = 2_500_000_000
+TV_EQUAL, TV_PERFORMANCE, TV_AUDIENCE = 0.50, 0.25, 0.25
+
+
+def gate_receipts(stadium_level, lnf, u):
+    """Renda de cada jogo em casa. lnf: mandante é da LNF (bool); u: uniformes em [0, 1)."""
+    income = stadium_level * TICKET_BASE * (TICKET_LOW + (TICKET_HIGH - TICKET_LOW) * u)
+    return (income * np.where(lnf, LNF_CROWD, 1)).astype(np.int64)
+
+
+def weekly_wages(payroll, wage_share):
+    return (payroll * wage_share / WEEKS_PER_YEAR).astype(np.int64)
+
+
+def facility_upkeep(stadium_level, training_level, youth_level):
+    return UPKEEP_BASE * (stadium_level ** 2 + training_level ** 2 + youth_level ** 2)
+
+
+def tv_installments(points, rating, pool=TV_POOL):
+    """Parcela semanal de cada time da LNF (pontos até agora; sem pontos, a cota é igual)"""
+    n = len(points)
+    if not n: return np.zeros(0, dtype=np.int64)
+    points = np.asarray(points, dtype=np.float64)
+    rating = np.asarray(rating, dtype=np.float64)
+    perf = points / points.sum() if points.sum() > 0 else np.full(n, 1 / n)
+    share = TV_EQUAL / n + TV_PERFORMANCE * perf + TV_AUDIENCE * rating / rating.sum()
+    return (pool * share / WEEKS_PER_YEAR).astype(np.int64)
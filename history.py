@@ -0,0 +1,191 @@
+import numpy as np
+
+from columns import Columns, grow
+
+# --- HISTÓRICO DA CARREIRA (COLUNAR) ---
+# Cada temporada encerrada vira linhas em colunas tipadas (campeões, artilheiros, classificação
+# final), sempre por id de time/jogador. Os agregados do Hall da Fama (títulos por clube,
+# artilheiros de todos os tempos, dinastias, recordes) são atualizados no fechamento de cada
+# temporada, então as páginas de recordes não dependem do tamanho da carreira.
+# Nomes de jogadores ficam guardados só para quem aparece no histórico (aposentados somem do universo).
+
+TITLES = ("LNF", "NCP", "Copa do Brasil")
+STANDINGS = ("LNF", "College")
+LEADERBOARD_SIZE = 50     # Artilheiros de todos os tempos mantidos em ordem
+SEASON_TOP_SCORERS = 10   # Linhas de artilharia guardadas por temporada
+
+SEASON_COLUMNS = {
+    "year": np.int16, "lnf": np.int32, "ncp": np.int32, "copa": np.int32,
+    "top_scorer": np.int32, "top_goals": np.int16, "mvp": np.int32,
+}
+STANDING_COLUMNS = {
+    "year": np.int16, "competition": np.int8, "team": np.int32, "rank": np.int16,
+    "points": np.int16, "wins": np.int16, "draws": np.int16, "losses": np.int16,
+    "goals_for": np.int16, "goals_against": np.int16,
+}
+SCORER_COLUMNS = {"year": np.int16, "player": np.int32, "team": np.int32, "goals": np.int16}
+
+
+class SeasonHistory:
+    def __init__(self):
+        self.seasons = Columns(SEASON_COLUMNS)
+        self.standings = Columns(STANDING_COLUMNS)
+        self.scorers = Columns(SCORER_COLUMNS)
+        self.names = {} # id do jogador -> nome (só quem aparece no histórico)
+
+        # Agregados incrementais
+        self.titles = np.zeros((len(TITLES), 64), dtype=np.int32) # [competição, time]
+        self.career_goals = np.zeros(1024, dtype=np.int32)        # Gols de todos os tempos por jogador
+        self.leaders = []          # Ids dos artilheiros de todos os tempos (maior total primeiro)
+        self.dynasties = []        # {competição, time, início, fim, títulos}
+        self._streaks = [None] * len(TITLES) # Por competição: (time, último título, índice em dynasties ou None)
+        self.season_record = None  # (jogador, ano, gols): maior artilharia numa temporada
+
+    def __len__(self):
+        return len(self.seasons)
+
+    # --- FECHAMENTO DE TEMPORADA ---
+
+    def close_season(self, year, champions, standings, player_ids, team_ids, goals, name_of, top_scorer=None):
+        """
+        Registra a temporada e atualiza os agregados.
+        champions: competição (de TITLES) -> id do time (-1 ou ausente = sem campeão)
+        standings: competição (de STANDINGS) -> linhas (time, pts, v, e, d, gp, gc) na ordem final
+        player_ids/team_ids/goals: gols da temporada de cada jogador (arrays alinhados, universo todo)
+        name_of(id do jogador) -> nome, chamado só para quem entra no histórico
+        top_scorer: id do artilheiro da temporada (padrão: o do universo); também é o MVP
+        """
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        goals = np.asarray(goals, dtype=np.int64)
+        champ = {c: champions.get(c, -1) for c in TITLES}
+        champ = {c: -1 if t is None else t for c, t in champ.items()}
+
+        # Artilharia da temporada (top N do universo)
+        order = np.lexsort((player_ids, -goals))[:SEASON_TOP_SCORERS]
+        order = order[goals[order] > 0]
+        self.scorers.extend(year=[year] * len(order), player=player_ids[order], team=team_ids[order], goals=goals[order])
+        if top_scorer is None and len(order): top_scorer = int(player_ids[order[0]])
+        top = -1 if top_scorer is None else top_scorer
+        top_goals = int(goals[player_ids == top].sum()) if top >= 0 else 0
+        for pid in player_ids[order].tolist() + ([top] if top >= 0 else []):
+            if pid not in self.names: self.names[pid] = name_of(pid)
+
+        self.seasons.append(year=year, lnf=champ["LNF"], ncp=champ["NCP"], copa=champ["Copa do Brasil"],
+                            top_scorer=top, top_goals=top_goals, mvp=top)
+        for comp, rows in standings.items():
+            if not rows: continue
+            cols = list(zip(*rows))
+            self.standings.extend(year=[year] * len(rows), competition=[STANDINGS.index(comp)] * len(rows),
+                                  team=cols[0], rank=range(1, len(rows) + 1), points=cols[1], wins=cols[2],
+                                  draws=cols[3], losses=cols[4], goals_for=cols[5], goals_against=cols[6])
+
+        self._count_titles(year, champ)
+        self._count_goals(player_ids, goals, name_of)
+        if top >= 0 and (self.season_record is None or top_goals > self.season_record[2]):
+            self.season_record = (top, year, top_goals)
+
+    def _count_titles(self, year, champ):
+        for c, comp in enumerate(TITLES):
+            team = champ[comp]
+            prev = self._streaks[c]
+            if team < 0:
+                self._streaks[c] = None
+                continue
+            self.titles = grow(self.titles, team + 1)
+            self.titles[c, team] += 1
+
+            # Dinastia: o mesmo time campeão em anos seguidos (a partir do 2º título)
+            if prev and prev[0] == team and prev[1] == year - 1:
+                idx = prev[2]
+                if idx is None:
+                    self.dynasties.append({"competition": comp, "team": team, "start": year - 1, "end": year, "titles": 2})
+                    idx = len(self.dynasties) - 1
+                else:
+                    self.dynasties[idx]["end"] = year
+                    self.dynasties[idx]["titles"] += 1
+                self._streaks[c] = (team, year, idx)
+            else:
+                self._streaks[c] = (team, year, None)
+
+    def _count_goals(self, player_ids, goals, name_of):
+        scored = goals > 0
+        ids, g = player_ids[scored], goals[scored]
+        if not len(ids): return
+        self.career_goals = grow(self.career_goals, int(ids.max()) + 1)
+        np.add.at(self.career_goals, ids, g)
+        # Totais só crescem: quem está fora do top só entra se marcou nesta temporada
+        candidates = np.union1d(np.asarray(self.leaders, dtype=np.int64), ids)
+        order = np.lexsort((candidates, -self.career_goals[candidates]))[:LEADERBOARD_SIZE]
+        self.leaders = candidates[order].tolist()
+        for pid in self.leaders:
+            if pid not in self.names: self.names[pid] = name_of(pid)
+
+    # --- CONSULTAS (HALL DA FAMA) ---
+
+    def champions(self, competition):
+        """(ano, id do time) de cada temporada"""
+        col = {"LNF": "lnf", "NCP": "ncp", "Copa do Brasil": "copa"}[competition]
+        return list(zip(self.seasons["year"].tolist(), self.seasons[col].tolist()))
+
+    def title_counts(self, n=10):
+        """[(id do time, {competição: títulos}, total)] dos maiores campeões"""
+        totals = self.titles.sum(axis=0)
+        order = np.lexsort((np.arange(len(totals)), -totals))[:n]
+        return [(int(t), {comp: int(self.titles[c, t]) for c, comp in enumerate(TITLES)}, int(totals[t]))
+                for t in order.tolist() if totals[t] > 0]
+
+    def all_time_scorers(self, n=10):
+        """[(id do jogador, nome, gols)] de todos os tempos"""
+        return [(pid, self.names.get(pid, "?"), int(self.career_goals[pid])) for pid in self.leaders[:n]]
+
+    def top_dynasties(self, n=10):
+        return sorted(self.dynasties, key=lambda d: (-d["titles"], d["start"]))[:n]
+
+    def final_standings(self, year, competition):
+        mask = (self.standings["year"] == year) & (self.standings["competition"] == STANDINGS.index(competition))
+        return {k: self.standings[k][mask].tolist() for k in STANDING_COLUMNS}
+
+    # --- PERSISTÊNCIA (colunas + nomes; os agregados são reconstruídos) ---
+
+    def to_arrays(self):
+        arrays = {}
+        for prefix, cols in (("season", self.seasons), ("standing", self.standings), ("scorer", self.scorers)):
+            for k in cols.dtypes: arrays[f"{prefix}_{k}"] = cols[k].copy()
+        scored = np.flatnonzero(self.career_goals)
+        arrays["goals_player"] = scored.astype(np.int32)
+        arrays["goals_total"] = self.career_goals[scored]
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, names):
+        h = cls()
+        h.names = {int(k): v for k, v in names.items()}
+        for prefix, cols in (("season", h.seasons), ("standing", h.standings), ("scorer", h.scorers)):
+            if f"{prefix}_year" in arrays and len(arrays[f"{prefix}_year"]):
+                cols.extend(**{k: np.asarray(arrays[f"{prefix}_{k}"]) for k in cols.dtypes})
+
+        # Títulos, dinastias e recorde: replay das temporadas; artilharia: totais gravados
+        for row in range(len(h.seasons)):
+            year = int(h.seasons["year"][row])
+            h._count_titles(year, {"LNF": int(h.seasons["lnf"][row]), "NCP": int(h.seasons["ncp"][row]),
+                                   "Copa do Brasil": int(h.seasons["copa"][row])})
+            top, top_goals = int(h.seasons["top_scorer"][row]), int(h.seasons["top_goals"][row])
+            if top >= 0 and (h.season_record is None or top_goals > h.season_record[2]):
+                h.season_record = (top, year, top_goals)
+        ids = np.asarray(arrays.get("goals_player", []), dtype=np.int64)
+        totals = np.asarray(arrays.get("goals_total", []), dtype=np.int64)
+        if len(ids):
+            h.career_goals = grow(h.career_goals, int(ids.max()) + 1)
+            h.career_goals[ids] = totals
+            order = np.lexsort((ids, -totals))[:LEADERBOARD_SIZE]
+            h.leaders = ids[order].tolist()
+        return h
+
+    def to_dict(self):
+        return {"columns": {k: v.tolist() for k, v in self.to_arrays().items()},
+                "names": {str(k): v for k, v in self.names.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls.from_arrays(data.get("columns", {}), data.get("names", {}))
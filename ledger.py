@@ -0,0 +1,150 @@
+import numpy as np
+
+from columns import Columns, grow
+
+# --- LIVRO-CAIXA (TRANSAÇÕES TIPADAS) ---
+# Todo dinheiro que entra ou sai de um clube vira uma linha append-only (ano, semana, time,
+# categoria, valor, contraparte, referência). O caixa (Team.budget) e a receita da temporada
+# (Team.revenue) só mudam aqui, e os totais por time/categoria da temporada e da carreira
+# são mantidos a cada lançamento: painéis financeiros leem os agregados sem varrer o livro.
+
+# Categorias (códigos pequenos na coluna "category")
+OPENING, TICKETS, TV, WAGES, TRANSFER, DRAFT, EVENT, FACILITY, UPKEEP = range(9)
+CATEGORY_NAMES = ("Saldo Inicial", "Bilheteria", "Direitos de TV", "Salários", "Transferências",
+                  "Draft", "Eventos", "Infraestrutura", "Manutenção")
+
+# Entradas nestas categorias contam como receita da temporada (Team.revenue)
+REVENUE_CATEGORIES = frozenset((TICKETS, TV, TRANSFER, DRAFT))
+
+ENTRY_COLUMNS = {
+    "year": np.int16, "week": np.int8, "team": np.int32, "category": np.int8,
+    "amount": np.int64, "counterparty": np.int32, "ref": np.int32,
+}
+
+
+class Ledger:
+    def __init__(self):
+        self.entries = Columns(ENTRY_COLUMNS)
+        self.totals = np.zeros((len(CATEGORY_NAMES), 64), dtype=np.int64) # Carreira: [categoria, time]
+        self.seasons = {} # ano -> [categoria, time] da temporada
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _tables(self, year, size):
+        """Agregados da carreira e da temporada com espaço para `size` times"""
+        self.totals = grow(self.totals, size)
+        table = self.seasons.get(year)
+        if table is None: table = np.zeros((len(CATEGORY_NAMES), 64), dtype=np.int64)
+        table = self.seasons[year] = grow(table, size)
+        return self.totals, table
+
+    def _aggregate(self, year, team_ids, categories, amounts):
+        for table in self._tables(year, int(team_ids.max()) + 1):
+            np.add.at(table, (categories, team_ids), amounts)
+
+    # --- LANÇAMENTOS ---
+
+    def post(self, year, week, team, amount, category, counterparty=None, ref=-1):
+        """Lança `amount` (positivo = entrada) no caixa do time"""
+        amount = int(amount)
+        team.budget += amount
+        if amount > 0 and category in REVENUE_CATEGORIES: team.revenue += amount
+        self.entries.append(year=year, week=week, team=team.id, category=category, amount=amount,
+                            counterparty=counterparty.id if counterparty is not None else -1, ref=ref)
+        for table in self._tables(year, team.id + 1):
+            table[category, team.id] += amount
+
+    def transfer(self, year, week, payer, payee, amount, category, ref=-1):
+        """Dinheiro de um clube para outro (duas linhas, soma zero)"""
+        self.post(year, week, payer, -amount, category, counterparty=payee, ref=ref)
+        self.post(year, week, payee, amount, category, counterparty=payer, ref=ref)
+
+    def post_many(self, year, week, teams, team_ids, amounts, categories, counterparties=-1, refs=-1):
+        """
+        Lançamento em lote, para acertos vetorizados. teams: a lista indexada por id (Engine.teams);
+        team_ids/amounts/categories: uma posição por linha (valores zerados não viram linha).
+        counterparties/refs: ids por linha (ou um valor para todas), como no post.
+        """
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        amounts = np.asarray(amounts, dtype=np.int64)
+        categories = np.broadcast_to(np.asarray(categories, dtype=np.int64), team_ids.shape)
+        counterparties = np.broadcast_to(np.asarray(counterparties, dtype=np.int64), team_ids.shape)
+        refs = np.broadcast_to(np.asarray(refs, dtype=np.int64), team_ids.shape)
+        keep = amounts != 0
+        team_ids, amounts, categories = team_ids[keep], amounts[keep], categories[keep]
+        counterparties, refs = counterparties[keep], refs[keep]
+        n = len(team_ids)
+        if not n: return
+
+        # Caixa: soma por time; receita: só entradas nas categorias de receita
+        revenue = (amounts > 0) & np.isin(categories, list(REVENUE_CATEGORIES))
+        budget_delta = np.bincount(team_ids, weights=amounts, minlength=len(teams)).astype(np.int64)
+        revenue_delta = np.bincount(team_ids[revenue], weights=amounts[revenue], minlength=len(teams)).astype(np.int64)
+        for tid in np.flatnonzero(budget_delta | revenue_delta).tolist():
+            teams[tid].budget += int(budget_delta[tid])
+            teams[tid].revenue += int(revenue_delta[tid])
+
+        self.entries.extend(year=np.full(n, year), week=np.full(n, week), team=team_ids, category=categories,
+                            amount=amounts, counterparty=counterparties, ref=refs)
+        self._aggregate(year, team_ids, categories, amounts)
+
+    def truncate(self, n):
+        """
+        Descarta os lançamentos a partir da linha `n` (desfazer semana), tirando-os dos agregados.
+        Caixa e receita dos times não são mexidos: quem desfaz restaura os dois junto.
+        """
+        if n >= len(self): return
+        tail = {k: self.entries[k][n:] for k in ("year", "team", "category", "amount")}
+        for year in np.unique(tail["year"]).tolist():
+            mask = tail["year"] == year
+            idx = (tail["category"][mask].astype(np.int64), tail["team"][mask].astype(np.int64))
+            for table in (self.totals, self.seasons[year]):
+                np.subtract.at(table, idx, tail["amount"][mask])
+        self.entries.truncate(n)
+        last_year = int(self.entries["year"][-1]) if n else None
+        for year in [y for y in self.seasons if last_year is None or y > last_year]:
+            del self.seasons[year]
+
+    # --- CONSULTAS (AGREGADOS) ---
+
+    def season_totals(self, year, team):
+        """{categoria: valor} do time na temporada"""
+        return self._row(self.seasons.get(year), team)
+
+    def career_totals(self, team):
+        return self._row(self.totals, team)
+
+    @staticmethod
+    def _row(table, team):
+        if table is None or team.id >= table.shape[1]: return dict.fromkeys(CATEGORY_NAMES, 0)
+        return {name: int(v) for name, v in zip(CATEGORY_NAMES, table[:, team.id].tolist())}
+
+    def recent(self, team, n=20):
+        """Últimos `n` lançamentos do time (mais recente primeiro)"""
+        rows = np.flatnonzero(self.entries["team"] == team.id)[-n:][::-1]
+        return [{k: self.entries[k][i].item() for k in ENTRY_COLUMNS} for i in rows.tolist()]
+
+    # --- PERSISTÊNCIA (só as linhas; os agregados são refeitos) ---
+
+    def to_arrays(self):
+        return {k: self.entries[k].copy() for k in ENTRY_COLUMNS}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        ledger = cls()
+        if len(arrays.get("year", ())):
+            ledger.entries.extend(**{k: np.asarray(arrays[k]) for k in ENTRY_COLUMNS})
+            years = ledger.entries["year"]
+            for year in np.unique(years).tolist():
+                mask = years == year
+                ledger._aggregate(year, ledger.entries["team"][mask].astype(np.int64),
+                                  ledger.entries["category"][mask].astype(np.int64), ledger.entries["amount"][mask])
+        return ledger
+
+    def to_dict(self):
+        return {k: v.tolist() for k, v in self.to_arrays().items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls.from_arrays(data)
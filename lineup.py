@@ -0,0 +1,165 @@
+import heapq
+import itertools
+
+from strength import FORMATIONS, DEFAULT_FORMATION, STARTER_SLOTS
+
+# --- ESCALAÇÃO (MELHOR XI INCREMENTAL) ---
+# Por posição, dois heaps: titulares (min-heap, o pior titular no topo) e reservas
+# (max-heap, o melhor reserva no topo). Entrada, saída ou evolução de um jogador só mexe
+# nos heaps da posição dele: se o melhor reserva passar o pior titular, os dois trocam.
+# Remoções são preguiçosas (a entrada é marcada como morta e descartada ao chegar ao topo).
+# Se a formação pede mais jogadores do que a posição tem, o XI é completado pelos melhores
+# reservas de outras posições (improvisados). A força do time não sai daqui: é a do
+# TeamStrength (team.strength), a mesma que a simulação usa.
+
+_ALIVE = 3 # Índice do flag na entrada [chave, seq, jogador, viva]
+
+
+class Lineup:
+    def __init__(self, players=(), formation=DEFAULT_FORMATION):
+        self.formation = formation
+        self.slots = FORMATIONS[formation]
+        self._xi = {pos: [] for pos in STARTER_SLOTS}    # (overall, seq, p)
+        self._bench = {pos: [] for pos in STARTER_SLOTS} # (-overall, seq, p)
+        self._n_xi = dict.fromkeys(STARTER_SLOTS, 0)
+        self._n_bench = dict.fromkeys(STARTER_SLOTS, 0)
+        self._entries = {} # id(jogador) -> (posição, titular?, entrada)
+        self._seq = itertools.count()
+        self._starters = None
+
+        for p in players:
+            self._push(p, p.overall, starter=False)
+        for pos in STARTER_SLOTS:
+            self._rebalance(pos)
+
+    # --- MUTAÇÕES ---
+
+    def add(self, player):
+        self._push(player, player.overall, starter=False)
+        self._rebalance(player.position)
+
+    def remove(self, player):
+        pos, starter, entry = self._entries.pop(id(player))
+        entry[_ALIVE] = False
+        if starter: self._n_xi[pos] -= 1
+        else: self._n_bench[pos] -= 1
+        self._rebalance(pos)
+        self._compact(pos)
+
+    def update(self, player, old, new):
+        """Overall mudou: reposiciona só o jogador (a posição dele é rebalanceada)"""
+        if old == new or id(player) not in self._entries: return
+        pos, starter, entry = self._entries.pop(id(player))
+        entry[_ALIVE] = False
+        if starter: self._n_xi[pos] -= 1
+        else: self._n_bench[pos] -= 1
+        self._push(player, new, starter)
+        self._rebalance(pos)
+        self._compact(pos)
+
+    def copy(self):
+        """Cópia independente (mesmos jogadores, heaps na mesma ordem): desfaz mudanças sem reconstruir"""
+        clone = Lineup.__new__(Lineup)
+        clone.formation, clone.slots = self.formation, self.slots
+        entries = {}
+        def dup(heap):
+            out = []
+            for e in heap:
+                out.append(list(e))
+                entries[id(e)] = out[-1]
+            return out
+        clone._xi = {pos: dup(heap) for pos, heap in self._xi.items()}
+        clone._bench = {pos: dup(heap) for pos, heap in self._bench.items()}
+        clone._n_xi, clone._n_bench = dict(self._n_xi), dict(self._n_bench)
+        clone._entries = {k: (pos, starter, entries[id(e)]) for k, (pos, starter, e) in self._entries.items()}
+        seq = next(self._seq)
+        self._seq, clone._seq = itertools.count(seq), itertools.count(seq)
+        clone._starters = self._starters
+        return clone
+
+    def set_formation(self, formation):
+        self.formation = formation
+        self.slots = FORMATIONS[formation]
+        for pos in STARTER_SLOTS:
+            self._rebalance(pos)
+
+    def _push(self, player, overall, starter):
+        pos = player.position
+        if starter:
+            entry = [overall, next(self._seq), player, True]
+            heapq.heappush(self._xi[pos], entry)
+            self._n_xi[pos] += 1
+        else:
+            entry = [-overall, next(self._seq), player, True]
+            heapq.heappush(self._bench[pos], entry)
+            self._n_bench[pos] += 1
+        self._entries[id(player)] = (pos, starter, entry)
+
+    def _pop(self, heap):
+        while heap:
+            entry = heapq.heappop(heap)
+            if entry[_ALIVE]: return entry
+        return None
+
+    def _top(self, heap):
+        while heap and not heap[0][_ALIVE]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _move(self, pos, to_starter):
+        if to_starter:
+            entry = self._pop(self._bench[pos])
+            self._n_bench[pos] -= 1
+            self._push(entry[2], -entry[0], starter=True)
+        else:
+            entry = self._pop(self._xi[pos])
+            self._n_xi[pos] -= 1
+            self._push(entry[2], entry[0], starter=False)
+
+    def _compact(self, pos):
+        """Descarta entradas mortas quando elas já são maioria nos heaps da posição"""
+        alive = self._n_xi[pos] + self._n_bench[pos]
+        if len(self._xi[pos]) + len(self._bench[pos]) <= 2 * alive + 8: return
+        for heap in (self._xi[pos], self._bench[pos]):
+            heap[:] = [e for e in heap if e[_ALIVE]]
+            heapq.heapify(heap)
+
+    def _rebalance(self, pos):
+        n = self.slots[pos]
+        while self._n_xi[pos] > n:
+            self._move(pos, to_starter=False)
+        while self._n_xi[pos] < n and self._n_bench[pos]:
+            self._move(pos, to_starter=True)
+        # Reserva melhor que o pior titular: troca
+        while True:
+            best, worst = self._top(self._bench[pos]), self._top(self._xi[pos])
+            if best is None or worst is None or -best[0] <= worst[0]: break
+            self._move(pos, to_starter=False)
+            self._move(pos, to_starter=True)
+        self._starters = None
+
+    # --- LEITURAS ---
+
+    @property
+    def starters(self):
+        """XI titular (por posição, do melhor para o pior), com improvisados se faltar gente"""
+        if self._starters is None:
+            xi = []
+            for pos in STARTER_SLOTS:
+                alive = [e for e in self._xi[pos] if e[_ALIVE]]
+                xi.extend(e[2] for e in sorted(alive, key=lambda e: -e[0]))
+            missing = sum(self.slots.values()) - len(xi)
+            if missing > 0:
+                bench = [e for heap in self._bench.values() for e in heap if e[_ALIVE]]
+                xi.extend(e[2] for e in heapq.nsmallest(missing, bench))
+            self._starters = xi
+        return self._starters
+
+    def worst_starter(self, position):
+        """Overall do pior titular da posição (0 se a posição não tem ninguém)"""
+        top = self._top(self._xi[position])
+        return top[0] if top else 0
+
+    def is_starter(self, player):
+        info = self._entries.get(id(player))
+        return bool(info and info[1])
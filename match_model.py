@@ -0,0 +1,143 @@
+import math
+
+import numpy as np
+
+# --- MODELO ANALÍTICO DE PARTIDA ---
+# Mesma matemática do simulate_match, só que fechada: rating efetivo -> probabilidade Elo ->
+# médias de Poisson independentes para cada lado. A partir daí V/E/D, distribuição de placares
+# e pontos esperados saem de somas sobre a grade de placares, sem sortear nada.
+# Como tudo só depende da diferença efetiva (força + mando + tática), os resultados ficam em
+# uma tabela indexada pela diferença inteira, e a tática entra como o par de códigos.
+
+AVG_GOALS = 2.5      # Gols esperados por time em jogo equilibrado (antes do piso)
+HOME_ADVANTAGE = 5   # Pontos de rating para o mandante
+TACTIC_BONUS = 8     # Bônus de quem "vence" o duelo tático
+ELO_SCALE = 400
+GOAL_FLOOR = 0.1     # Mesmo o azarão tem média mínima de AVG_GOALS * 0.1
+
+MAX_GOALS = 12       # Grade de placares 0..12 (massa restante < 1e-6 para as médias do jogo)
+DIFF_RANGE = 150     # Tabela cobre diferenças efetivas de -150 a +150
+
+# --- TÁTICAS (PEDRA-PAPEL-TESOURA) ---
+# Códigos: 0 = Posse, 1 = Contra-Ataque, 2 = Retranca, 3 = neutro (Equilibrado, Gegenpress, sem técnico)
+TACTIC_KEYS = ("Posse", "Contra-Ataque", "Retranca")
+TACTIC_BEATS = {1: 0, 2: 1, 0: 2} # Contra-Ataque > Posse, Retranca > Contra-Ataque, Posse > Retranca
+NEUTRAL_TACTIC = 3
+
+
+def tactic_code(style):
+    if not style: return NEUTRAL_TACTIC
+    for code, key in enumerate(TACTIC_KEYS):
+        if key in style: return code
+    return NEUTRAL_TACTIC
+
+
+def tactical_edge(code_a, code_b):
+    """+1 se a tática de A vence a de B, -1 se perde, 0 se neutro"""
+    if TACTIC_BEATS.get(code_a) == code_b: return 1
+    if TACTIC_BEATS.get(code_b) == code_a: return -1
+    return 0
+
+
+TACTIC_EDGE_MATRIX = np.array([[tactical_edge(a, b) for b in range(4)] for a in range(4)])
+
+
+def goal_expectations(diff, avg_goals=AVG_GOALS, elo_scale=ELO_SCALE, goal_floor=GOAL_FLOOR):
+    """
+    Médias de gols (A, B) a partir da diferença efetiva de rating. Aceita escalar ou array.
+    As constantes podem ser trocadas (calibration.py testa outras combinações com a mesma conta).
+    """
+    prob_a = 1 / (1 + 10 ** (-np.asarray(diff, dtype=float) / elo_scale))
+    return avg_goals * (prob_a + goal_floor), avg_goals * ((1 - prob_a) + goal_floor)
+
+
+def effective_diff(strength_a, strength_b, code_a=NEUTRAL_TACTIC, code_b=NEUTRAL_TACTIC, home=True,
+                   home_advantage=HOME_ADVANTAGE, tactic_bonus=TACTIC_BONUS):
+    edge = TACTIC_EDGE_MATRIX[code_a, code_b]
+    return strength_a + edge * tactic_bonus + (home_advantage if home else 0) - strength_b
+
+
+def _poisson_pmf(lam):
+    """PMF truncada em 0..MAX_GOALS; lam com shape (...) -> (..., MAX_GOALS+1)"""
+    lam = np.asarray(lam, dtype=float)[..., None]
+    k = np.arange(MAX_GOALS + 1)
+    log_fact = np.array([math.lgamma(i + 1) for i in k])
+    pmf = np.exp(k * np.log(lam) - lam - log_fact)
+    return pmf / pmf.sum(axis=-1, keepdims=True) # Renormaliza a cauda cortada
+
+
+class MatchOutcome:
+    """Probabilidades exatas de um confronto (A = mandante, B = visitante)"""
+    def __init__(self, win, draw, loss, xg_a, xg_b, scores):
+        self.win = win
+        self.draw = draw
+        self.loss = loss
+        self.xg_a = xg_a
+        self.xg_b = xg_b
+        self.scores = scores # scores[i, j] = P(A faz i, B faz j)
+
+    @property
+    def expected_points_a(self):
+        return 3 * self.win + self.draw
+
+    @property
+    def expected_points_b(self):
+        return 3 * self.loss + self.draw
+
+    @property
+    def knockout_win(self):
+        """Chance de A avançar no mata-mata (empate vai para moeda justa, como no motor)"""
+        return self.win + self.draw / 2
+
+    def most_likely_score(self):
+        i, j = np.unravel_index(np.argmax(self.scores), self.scores.shape)
+        return int(i), int(j)
+
+    def __repr__(self):
+        return f"V {self.win:.1%} | E {self.draw:.1%} | D {self.loss:.1%} (xG {self.xg_a:.2f} x {self.xg_b:.2f})"
+
+
+class OutcomeTable:
+    """
+    Tabela pré-computada por diferença efetiva inteira (-DIFF_RANGE..+DIFF_RANGE).
+    Consultas por força + par de táticas + mando custam uma indexação.
+    """
+    def __init__(self):
+        diffs = np.arange(-DIFF_RANGE, DIFF_RANGE + 1)
+        lam_a, lam_b = goal_expectations(diffs)
+        pa, pb = _poisson_pmf(lam_a), _poisson_pmf(lam_b)
+        self.scores = pa[:, :, None] * pb[:, None, :] # (n_diffs, gols_a, gols_b)
+
+        i = np.arange(MAX_GOALS + 1)
+        self.win = (self.scores * (i[:, None] > i[None, :])).sum(axis=(1, 2))
+        self.draw = np.trace(self.scores, axis1=1, axis2=2)
+        self.loss = (self.scores * (i[:, None] < i[None, :])).sum(axis=(1, 2))
+        self.xg_a = lam_a
+        self.xg_b = lam_b
+
+    def _index(self, diff):
+        return np.clip(np.rint(diff).astype(np.int64), -DIFF_RANGE, DIFF_RANGE) + DIFF_RANGE
+
+    def lookup(self, strength_a, strength_b, code_a=NEUTRAL_TACTIC, code_b=NEUTRAL_TACTIC, home=True):
+        idx = int(self._index(effective_diff(strength_a, strength_b, code_a, code_b, home)))
+        return MatchOutcome(float(self.win[idx]), float(self.draw[idx]), float(self.loss[idx]),
+                            float(self.xg_a[idx]), float(self.xg_b[idx]), self.scores[idx])
+
+    def knockout_matrix(self, strengths, codes, home=True):
+        """P[i, j] = chance de i (mandante) eliminar j, para todos os pares de uma vez"""
+        strengths = np.asarray(strengths, dtype=float)
+        codes = np.asarray(codes)
+        diff = effective_diff(strengths[:, None], strengths[None, :], codes[:, None], codes[None, :], home)
+        idx = self._index(diff)
+        return self.win[idx] + self.draw[idx] / 2
+
+    def points_matrix(self, strengths, codes, home=True):
+        """Pontos esperados do mandante i contra j (3 por vitória, 1 por empate)"""
+        strengths = np.asarray(strengths, dtype=float)
+        codes = np.asarray(codes)
+        diff = effective_diff(strengths[:, None], strengths[None, :], codes[:, None], codes[None, :], home)
+        idx = self._index(diff)
+        return 3 * self.win[idx] + self.draw[idx]
+
+
+OUTCOMES = OutcomeTable()
@@ -0,0 +1,117 @@
+import bisect
+import math
+from itertools import accumulate
+
+import numpy as np
+
+# --- POOL DE VARIÁVEIS ALEATÓRIAS (HOT PATH DAS PARTIDAS) ---
+# Cada chamada escalar ao NumPy custa microssegundos de overhead. O pool sorteia uniformes
+# em blocos grandes (uma chamada vetorizada) e entrega um por vez a partir de uma lista Python.
+# Poisson, inteiros, escolhas e amostras são derivados desses uniformes, então a sequência
+# inteira é reproduzível a partir da semente.
+
+DEFAULT_BLOCK = 65_536
+# Acima disso a inversão da CDF da Poisson fica lenta; delega direto ao gerador
+POISSON_INVERSION_MAX = 30.0
+
+
+class VariatePool:
+    def __init__(self, seed=None, block_size=DEFAULT_BLOCK):
+        self.block_size = block_size
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        self._gen = np.random.default_rng(seed)
+        self._block = []
+        self._idx = 0
+        self._block_state = None
+
+    def _refill(self):
+        self._block_state = self._gen.bit_generator.state
+        self._block = self._gen.random(self.block_size).tolist()
+        self._idx = 0
+
+    # --- Estado (para checkpoints/replay) ---
+    def get_state(self):
+        """Estado compacto: gerador no início do bloco atual + posição dentro dele"""
+        return (self._block_state, self._idx, self._gen.bit_generator.state)
+
+    def set_state(self, state):
+        block_state, idx, gen_state = state
+        if block_state is None:
+            self._gen.bit_generator.state = gen_state
+            self._block = []
+            self._idx = 0
+            self._block_state = None
+            return
+        self._gen.bit_generator.state = block_state
+        self._refill()
+        self._idx = idx
+        # Sorteios em lote feitos depois do bloco também avançaram o gerador
+        self._gen.bit_generator.state = gen_state
+
+    # --- Sorteios escalares ---
+    def random(self):
+        """Uniforme em [0, 1)"""
+        if self._idx >= len(self._block): self._refill()
+        u = self._block[self._idx]
+        self._idx += 1
+        return u
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        """Inteiro em [a, b] (inclusivo, como random.randint)"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def poisson(self, lam):
+        """Poisson por inversão da CDF (exato; ~lam iterações para as médias de gols do jogo)"""
+        if lam <= 0: return 0
+        if lam > POISSON_INVERSION_MAX:
+            return int(self._gen.poisson(lam))
+        u = self.random()
+        k = 0
+        p = math.exp(-lam)
+        cdf = p
+        while u > cdf:
+            k += 1
+            p *= lam / k
+            cdf += p
+            if p <= 0: break # Cauda numérica esgotada
+        return k
+
+    def choices(self, population, weights=None, k=1, cum_weights=None):
+        """Equivalente a random.choices, com pesos acumulados reaproveitáveis"""
+        if cum_weights is None:
+            if weights is None:
+                n = len(population)
+                return [population[int(self.random() * n)] for _ in range(k)]
+            cum_weights = list(accumulate(weights))
+        total = cum_weights[-1]
+        hi = len(cum_weights) - 1
+        return [population[bisect.bisect_right(cum_weights, self.random() * total, 0, hi)] for _ in range(k)]
+
+    def sample(self, population, k):
+        """k elementos distintos (Fisher-Yates parcial)"""
+        pool = list(population)
+        n = len(pool)
+        for i in range(k):
+            j = i + int(self.random() * (n - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    # --- Sorteios em lote (caminhos vetorizados) ---
+    def poisson_many(self, lam, size=None):
+        return self._gen.poisson(lam, size)
+
+    def random_many(self, size):
+        return self._gen.random(size)
+
+    @property
+    def generator(self):
+        """Gerador NumPy subjacente, para quem precisa de distribuições em lote"""
+        return self._gen
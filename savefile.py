@@ -0,0 +1,328 @@
+import json
+import io
+
+import numpy as np
+
+from engine import UniFUTEngine, Team, Player, Coach, Match, Calendar, POSITIONS, POSITION_CODES
+from strength import TeamStrength, FORMATIONS
+from history import SeasonHistory
+from ledger import Ledger
+
+# --- SAVE BINÁRIO (MEMORY-MAPPED) ---
+# Layout do arquivo:
+#   MAGIC (8 bytes) | tamanho do cabeçalho (uint32) | cabeçalho JSON | blocos de arrays alinhados em 64 bytes
+# O cabeçalho guarda só metadados (ano, semana, nomes do histórico, tabela de strings e o offset/dtype de cada array).
+# Jogadores, times e partidas viram colunas tipadas; o load faz memmap e só cria Player ao acessar o elenco.
+
+MAGIC = b"UNIFUTB1"
+# Sobe a cada mudança de layout (colunas, arrays ou chaves do cabeçalho); o load só aceita a atual.
+# 2: ids de jogadores/técnicos/jogos, free agents (time -1), gols, histórico, livro-caixa,
+#    chaves de playoff e tamanho do registro de jogadores
+FORMAT_VERSION = 2
+ALIGN = 64
+
+PLAYER_COLUMNS = {
+    "id": np.int32, "position": np.uint8, "age": np.int16, "overall": np.int16, "potential": np.int16,
+    "team": np.int32, "contract_years": np.int16, "market_value": np.int64, "wage": np.int64,
+    "goals": np.int32, "assists": np.int32, "matches": np.int32, "mvp_points": np.int32,
+    "last_evolution": np.int16,
+}
+
+TEAM_COLUMNS = {
+    "name": np.int32, "league": np.int32, "conference": np.int32, "division": np.int32,
+    "rating": np.int32, "budget": np.int64, "payroll": np.int64, "revenue": np.int64,
+    "salary_cap": np.int64, "is_human": np.uint8, "next_tactic": np.int32,
+    "stadium_level": np.int8, "training_level": np.int8, "youth_level": np.int8,
+    "wins": np.int32, "losses": np.int32, "draws": np.int32, "points": np.int32,
+    "goals_for": np.int32, "goals_against": np.int32,
+    "coach_id": np.int32, "coach_name": np.int32, "coach_style": np.int32, "coach_age": np.int16, "formation": np.int32,
+    "player_start": np.int64, "player_count": np.int32,
+}
+
+# Colunas de time copiadas como estão para o Team.restore
+TEAM_STATE = ("budget", "payroll", "revenue", "salary_cap", "stadium_level", "training_level", "youth_level",
+              "wins", "losses", "draws", "points", "goals_for", "goals_against")
+
+FIXTURE_COLUMNS = {
+    "id": np.int32, "week": np.int16, "home": np.int32, "away": np.int32, "competition": np.int32,
+    "played": np.uint8, "home_score": np.int16, "away_score": np.int16,
+}
+
+
+class _StringTable:
+    """Tabela de strings repetidas (ligas, conferências, competições...) referenciadas por índice"""
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def code(self, value):
+        if value is None: return -1
+        if value not in self.index:
+            self.index[value] = len(self.values)
+            self.values.append(value)
+        return self.index[value]
+
+
+def _encode_names(names):
+    """Concatena nomes em um blob UTF-8 com offsets (n+1) para decodificar sob demanda"""
+    encoded = [n.encode("utf-8") for n in names]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _add_player(player_cols, player_names, p, team_idx):
+    player_names.append(p.name)
+    player_cols["id"].append(p.id)
+    player_cols["position"].append(p._pos)
+    player_cols["team"].append(team_idx)
+    for attr in ("age", "overall", "potential", "contract_years", "market_value", "wage",
+                 "goals", "assists", "matches", "mvp_points", "last_evolution"):
+        player_cols[attr].append(getattr(p, attr))
+
+
+def _build_arrays(engine):
+    strings = _StringTable()
+    arrays = {}
+
+    # 1. Times e Jogadores (jogadores contíguos por time para o elenco virar uma fatia)
+    team_cols = {k: [] for k in TEAM_COLUMNS}
+    player_cols = {k: [] for k in PLAYER_COLUMNS}
+    player_names = []
+    team_index = {}
+
+    for idx, t in enumerate(engine.teams):
+        team_index[id(t)] = idx
+        team_cols["name"].append(strings.code(t.name))
+        team_cols["league"].append(strings.code(t.league))
+        team_cols["conference"].append(strings.code(t.conference))
+        team_cols["division"].append(strings.code(t.division))
+        team_cols["next_tactic"].append(strings.code(t.next_tactic))
+        team_cols["formation"].append(strings.code(t.formation))
+        team_cols["coach_id"].append(t.coach.id if t.coach else -1)
+        team_cols["coach_name"].append(strings.code(t.coach.name) if t.coach else -1)
+        team_cols["coach_style"].append(strings.code(t.coach.style) if t.coach else -1)
+        team_cols["coach_age"].append(t.coach.age if t.coach else 0)
+        for attr in ("rating", "budget", "payroll", "revenue", "salary_cap", "is_human",
+                     "stadium_level", "training_level", "youth_level",
+                     "wins", "losses", "draws", "points", "goals_for", "goals_against"):
+            team_cols[attr].append(getattr(t, attr))
+
+        team_cols["player_start"].append(len(player_names))
+        team_cols["player_count"].append(len(t.players))
+        for p in t.players: _add_player(player_cols, player_names, p, idx)
+
+    # Free agents e aposentados continuam no registro (gols, histórico e arquivo apontam para eles):
+    # vão depois de todos os elencos, com time -1
+    for pid in range(len(engine.players)):
+        p = engine.players[pid] or engine.get_player(pid)
+        if p is not None and p._team is None: _add_player(player_cols, player_names, p, -1)
+
+    for k, dt in TEAM_COLUMNS.items(): arrays[f"team_{k}"] = np.asarray(team_cols[k], dtype=dt)
+    for k, dt in PLAYER_COLUMNS.items(): arrays[f"player_{k}"] = np.asarray(player_cols[k], dtype=dt)
+    arrays["player_name_data"], arrays["player_name_offsets"] = _encode_names(player_names)
+
+    # 2. Calendário (jogos com times fora do universo são descartados)
+    fixture_cols = {k: [] for k in FIXTURE_COLUMNS}
+    for m in engine.calendar.matches:
+        home = team_index.get(id(m.home_team))
+        away = team_index.get(id(m.away_team))
+        if home is None or away is None: continue
+        fixture_cols["id"].append(m.id)
+        fixture_cols["week"].append(m.week)
+        fixture_cols["home"].append(home)
+        fixture_cols["away"].append(away)
+        fixture_cols["competition"].append(strings.code(m.competition))
+        fixture_cols["played"].append(m.played)
+        fixture_cols["home_score"].append(m.home_score)
+        fixture_cols["away_score"].append(m.away_score)
+    for k, dt in FIXTURE_COLUMNS.items(): arrays[f"fixture_{k}"] = np.asarray(fixture_cols[k], dtype=dt)
+
+    # 3. Gols da temporada em andamento (vão para o arquivo de temporadas na virada de ano)
+    goals = np.asarray(engine.goal_events, dtype=np.int32).reshape(-1, 3)
+    for j, k in enumerate(("match", "team", "player")): arrays[f"goal_{k}"] = np.ascontiguousarray(goals[:, j])
+
+    # 4. Histórico colunar (os agregados do Hall da Fama são refeitos no load)
+    for k, arr in engine.history.to_arrays().items(): arrays[f"history_{k}"] = arr
+
+    # 5. Livro-caixa (só as linhas; os totais por time/categoria são refeitos no load)
+    for k, arr in engine.ledger.to_arrays().items(): arrays[f"ledger_{k}"] = arr
+
+    return arrays, strings.values
+
+
+def save_binary(engine, target):
+    """
+    Grava a carreira no formato binário.
+    `target` pode ser um caminho ou um arquivo aberto em modo binário.
+    """
+    arrays, strings = _build_arrays(engine)
+
+    layout = {}
+    offset = 0
+    for name, arr in arrays.items():
+        offset = -(-offset // ALIGN) * ALIGN
+        layout[name] = {"dtype": arr.dtype.str, "count": int(arr.size), "offset": offset}
+        offset += arr.nbytes
+
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "season_year": engine.season_year,
+        "career_id": engine.career_id,
+        "current_week": engine.current_week,
+        "player_registry": len(engine.players), # Próximo id livre (inclui ids de quem saiu do universo)
+        "history_names": {str(k): v for k, v in engine.history.names.items()},
+        "playoffs": engine.playoff_state(), # Chaves e campeões da temporada (pequeno: vai no cabeçalho)
+        "strings": strings,
+        "arrays": layout,
+    }, ensure_ascii=False).encode("utf-8")
+
+    # Os offsets do layout são relativos ao início da área de dados
+    data_start = -(-(len(MAGIC) + 4 + len(header)) // ALIGN) * ALIGN
+
+    if isinstance(target, (str, bytes)) or hasattr(target, "__fspath__"):
+        with open(target, "wb") as f:
+            _write(f, header, data_start, arrays, layout)
+    else:
+        _write(target, header, data_start, arrays, layout)
+
+
+def _write(f, header, data_start, arrays, layout):
+    f.write(MAGIC)
+    f.write(np.uint32(len(header)).tobytes())
+    f.write(header)
+    written = len(MAGIC) + 4 + len(header)
+    for name, arr in arrays.items():
+        pos = data_start + layout[name]["offset"]
+        f.write(b"\0" * (pos - written))
+        f.write(arr.tobytes())
+        written = pos + arr.nbytes
+
+
+def dump_binary(engine):
+    """Retorna o save binário como bytes (para o botão de download)"""
+    buf = io.BytesIO()
+    save_binary(engine, buf)
+    return buf.getvalue()
+
+
+class BinarySave:
+    """Visão memory-mapped de um save binário. Os arrays não são copiados para a memória."""
+    def __init__(self, path):
+        self._mm = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(self._mm[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} não é um save binário da UniFUT")
+
+        header_len = int(self._mm[len(MAGIC):len(MAGIC) + 4].view(np.uint32)[0])
+        header_end = len(MAGIC) + 4 + header_len
+        self.header = json.loads(bytes(self._mm[len(MAGIC) + 4:header_end]).decode("utf-8"))
+        if self.header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Versão de save não suportada: {self.header['version']} (esta versão lê a {FORMAT_VERSION})")
+
+        self.strings = self.header["strings"]
+        data_start = -(-header_end // ALIGN) * ALIGN
+        self.arrays = {}
+        for name, spec in self.header["arrays"].items():
+            dt = np.dtype(spec["dtype"])
+            start = data_start + spec["offset"]
+            self.arrays[name] = self._mm[start:start + spec["count"] * dt.itemsize].view(dt)
+
+    def string(self, code):
+        return self.strings[code] if code >= 0 else None
+
+    def player_name(self, idx):
+        offs = self.arrays["player_name_offsets"]
+        return bytes(self.arrays["player_name_data"][offs[idx]:offs[idx + 1]]).decode("utf-8")
+
+    def free_player_loader(self, engine):
+        """Loader de um jogador fora dos elencos (linhas com time -1), pelo id"""
+        ids = self.arrays["player_id"]
+        free = np.flatnonzero(self.arrays["player_team"] < 0)
+        row_of = dict(zip(ids[free].tolist(), free.tolist()))
+        def load(player_id):
+            row = row_of.get(player_id)
+            if row is None: return None
+            a = {k: self.arrays[f"player_{k}"][row].item() for k in PLAYER_COLUMNS}
+            return engine.register_player(Player.restore(
+                self.player_name(row), POSITIONS[a["position"]], a["age"], a["overall"], a["potential"],
+                a["contract_years"], a["market_value"], a["wage"], goals=a["goals"], assists=a["assists"],
+                matches=a["matches"], mvp_points=a["mvp_points"], last_evolution=a["last_evolution"],
+                player_id=player_id))
+        return load
+
+    def roster_loader(self, start, count, engine):
+        """Fábrica do loader preguiçoso de um elenco (fatia contígua das colunas de jogadores)"""
+        def load():
+            cols = {k: self.arrays[f"player_{k}"][start:start + count].tolist() for k in PLAYER_COLUMNS}
+            return [
+                engine.register_player(Player.restore(
+                    self.player_name(start + i), POSITIONS[cols["position"][i]], cols["age"][i],
+                    cols["overall"][i], cols["potential"][i], cols["contract_years"][i],
+                    cols["market_value"][i], cols["wage"][i], goals=cols["goals"][i],
+                    assists=cols["assists"][i], matches=cols["matches"][i],
+                    mvp_points=cols["mvp_points"][i], last_evolution=cols["last_evolution"][i],
+                    player_id=cols["id"][i]))
+                for i in range(count)
+            ]
+        return load
+
+    def to_engine(self):
+        """Reconstrói a Engine. Times e calendário são criados na hora; os elencos só no 1º acesso."""
+        engine = UniFUTEngine()
+        engine.season_year = self.header["season_year"]
+        engine.career_id = self.header["career_id"]
+        engine.current_week = self.header["current_week"]
+        history = {k[len("history_"):]: arr for k, arr in self.arrays.items() if k.startswith("history_")}
+        engine.history = SeasonHistory.from_arrays(history, self.header["history_names"])
+        engine.ledger = Ledger.from_arrays({k[len("ledger_"):]: arr for k, arr in self.arrays.items()
+                                            if k.startswith("ledger_")})
+
+        # Registro de jogadores com lacunas: cada id aponta para o time que o materializa (-1 = fora dos elencos).
+        # O tamanho vem do cabeçalho, para ids de quem já saiu do universo não serem reusados
+        ids = self.arrays["player_id"]
+        n_ids = self.header["player_registry"]
+        engine.players = [None] * n_ids
+        engine._lazy_player_teams = np.full(n_ids, -1, dtype=np.int32)
+        engine._lazy_player_teams[ids] = self.arrays["player_team"]
+        engine._lazy_free_player = self.free_player_loader(engine)
+
+        cols = {k: self.arrays[f"team_{k}"].tolist() for k in TEAM_COLUMNS}
+        positions = [POSITIONS[c] for c in self.arrays["player_position"].tolist()]
+        overalls = self.arrays["player_overall"].tolist()
+        for i in range(len(cols["name"])):
+            coach = None
+            if cols["coach_name"][i] >= 0:
+                coach = Coach(self.string(cols["coach_name"][i]), self.string(cols["coach_style"][i]), cols["coach_age"][i])
+                coach.id = cols["coach_id"][i]
+            formation = self.string(cols["formation"][i])
+            start, count = cols["player_start"][i], cols["player_count"][i]
+            # Agregados de força saem direto das colunas, sem materializar o elenco
+            strength = TeamStrength(zip(positions[start:start + count], overalls[start:start + count]),
+                                    FORMATIONS[formation])
+            t = Team.restore(self.string(cols["name"][i]), self.string(cols["league"][i]),
+                             self.string(cols["conference"][i]), self.string(cols["division"][i]), cols["rating"][i],
+                             formation, strength, self.roster_loader(start, count, engine), coach=coach,
+                             is_human=bool(cols["is_human"][i]), next_tactic=self.string(cols["next_tactic"][i]),
+                             **{attr: cols[attr][i] for attr in TEAM_STATE})
+            engine.add_team(t)
+
+        engine.calendar = Calendar()
+        fx = {k: self.arrays[f"fixture_{k}"].tolist() for k in FIXTURE_COLUMNS}
+        for i in range(len(fx["week"])):
+            m = Match(engine.teams[fx["home"][i]], engine.teams[fx["away"][i]], fx["week"][i], self.string(fx["competition"][i]))
+            m.played = bool(fx["played"][i])
+            m.home_score = fx["home_score"][i]
+            m.away_score = fx["away_score"][i]
+            engine.calendar.add_match(m)
+            m.id = fx["id"][i]
+
+        engine.goal_events = list(zip(*(self.arrays[f"goal_{k}"].tolist() for k in ("match", "team", "player"))))
+        engine.restore_playoff_state(self.header["playoffs"])
+
+        return engine
+
+
+def load_binary(path):
+    """Carrega um save binário com memmap (elencos materializados sob demanda)"""
+    return BinarySave(path).to_engine()
@@ -0,0 +1,103 @@
+import numpy as np
+
+# --- CENÁRIOS DA SEMANA (TODOS OS CLUBES) ---
+# Uma rolagem vetorizada por semana decide quais clubes têm evento e de qual tipo. Os clubes
+# da IA decidem pela política da diretoria na hora; só os cenários do clube humano viram
+# Scenario (com texto) e entram na fila da UI. Os efeitos carregam ids, não objetos, então
+# continuam válidos depois de um save/load ou de o jogador mudar de clube.
+
+SELL_STAR, LOCKER_ROOM, INVEST_YOUTH = range(3)
+NO_EVENT = -1
+
+EVENT_CHANCE = 30 # % de chance de um clube ter evento na semana
+# Faixas do segundo dado (1-100): até 30 proposta pelo craque, até 50 briga, até 70 base, resto nada
+EVENT_BANDS = ((30, SELL_STAR), (50, LOCKER_ROOM), (70, INVEST_YOUTH))
+
+SHEIK_PREMIUM = 1.5        # Oferta irrecusável (50% acima do valor de mercado)
+DISCIPLINE_FINE = 50_000   # Multa que volta pro clube
+YOUTH_INVESTMENT = 0.05    # Fração do caixa pedida pela base
+YOUTH_AGE = 21             # Quem aproveita o investimento na base
+
+
+class Scenario:
+    def __init__(self, title, description, options, effects, team_id=-1):
+        self.title = title
+        self.description = description
+        self.options = options # Lista ["Aceitar", "Recusar"]
+        self.effects = effects # Dicts de efeito (com ids), um por opção
+        self.team_id = team_id
+        self.chosen_option = None
+
+    def resolve(self, choice_idx):
+        self.chosen_option = choice_idx
+        # O efeito será aplicado pela engine
+        return self.effects[choice_idx]
+
+
+def roll_events(gen, has_players):
+    """Tipo de evento de cada clube na semana (NO_EVENT = semana tranquila)"""
+    n = len(has_players)
+    trigger = gen.integers(1, 101, n) <= EVENT_CHANCE
+    dice = gen.integers(1, 101, n)
+    kind = np.select([dice <= limit for limit, _ in EVENT_BANDS], [k for _, k in EVENT_BANDS], NO_EVENT)
+    # Sem elenco não há craque para vender: a faixa vira a da briga
+    kind[(kind == SELL_STAR) & ~np.asarray(has_players)] = LOCKER_ROOM
+    return np.where(trigger, kind, NO_EVENT)
+
+
+def star_player(team):
+    """Melhor jogador do elenco (um max, sem ordenar)"""
+    return max(team.players, key=lambda p: p.overall)
+
+
+def event_effects(kind, team, star=None):
+    """Efeitos das duas opções (a primeira é a 'ação', a segunda é deixar como está)"""
+    if kind == SELL_STAR:
+        return [{"type": "sell_player", "player_id": star.id, "value": int(star.market_value * SHEIK_PREMIUM)},
+                {"type": "morale_boost", "value": 0}] # Nada acontece, só mantém o jogador
+    if kind == LOCKER_ROOM:
+        return [{"type": "fine_players", "value": DISCIPLINE_FINE}, # Ganha um troco, impõe respeito
+                {"type": "risk_form", "value": -5}] # Risco de queda de rendimento
+    return [{"type": "invest_youth", "cost": int(team.budget * YOUTH_INVESTMENT)}, {"type": "none"}]
+
+
+def make_scenario(kind, team, star=None):
+    """Cenário com texto, para o clube humano decidir na UI"""
+    effects = event_effects(kind, team, star)
+    if kind == SELL_STAR:
+        offer_value = effects[0]["value"]
+        return Scenario(
+            title="💰 Proposta Irrecusável do Oriente Médio",
+            description=f"Um sheik ofereceu R$ {offer_value/1e6:.1f}M pelo seu craque **{star.name}** (Ovr {star.overall}).\n\nA diretoria deixa a decisão com você, mas avisa que o dinheiro seria ótimo para o caixa.",
+            options=["Vender (O dinheiro é bom)", "Segurar (Precisamos dele)"],
+            effects=effects, team_id=team.id)
+    if kind == LOCKER_ROOM:
+        return Scenario(
+            title="🔥 Briga no Treino",
+            description="Dois titulares discutiram feio por causa de uma entrada dura. O clima pesou e o grupo espera uma reação sua.",
+            options=["Multar ambos (Disciplina)", "Conversar e perdoar (Apaziguar)"],
+            effects=effects, team_id=team.id)
+    cost = effects[0]["cost"]
+    return Scenario(
+        title="🏗️ Reforma no Centro de Treinamento",
+        description=f"O coordenador da base pede R$ {cost/1e6:.1f}M para comprar equipamentos novos de fisiologia. Isso pode acelerar a evolução dos jovens.",
+        options=["Aprovar Investimento", "Negar (Sem verba)"],
+        effects=effects, team_id=team.id)
+
+
+def ai_choice(team, effects, wage_share):
+    """
+    Política da diretoria (índice da opção). Reserva = folha paga no ano (folha * wage_share).
+    - vende o craque só se o caixa está abaixo da reserva;
+    - investe na base se há jovens, a receita da temporada cobre o pedido e o caixa segue acima da reserva;
+    - sempre multa na briga.
+    """
+    effect = effects[0]
+    reserve = team.payroll * wage_share
+    if effect["type"] == "sell_player":
+        return 0 if team.budget < reserve else 1
+    if effect["type"] == "invest_youth":
+        cost = effect["cost"]
+        if cost > team.revenue or team.budget - cost < reserve: return 1
+        return 0 if any(p.age < YOUTH_AGE for p in team.players) else 1
+    return 0 # Disciplina
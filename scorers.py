@@ -0,0 +1,52 @@
+import numpy as np
+
+# --- TABELAS DE AUTORES DE GOL (CACHE POR ELENCO) ---
+# Quem marca é sorteado com peso por posição. O elenco só muda em janelas, eventos e viradas
+# de ano, então cada time guarda a tabela pronta e só a refaz quando o elenco muda.
+# A tabela de alias (Vose) sorteia um autor em O(1) com um único uniforme.
+
+GOAL_WEIGHTS = {"ATA": 10, "MID": 3, "DEF": 1, "GK": 0.1}
+
+
+class ScorerTable:
+    def __init__(self, players):
+        self.players = list(players)
+        weights = [GOAL_WEIGHTS.get(p.position, 0.1) for p in self.players]
+        prob, alias = _build_alias(weights)
+        # Em lista: o sorteio é escalar, e indexar numpy escalar é lento
+        self._prob = prob.tolist()
+        self._alias = alias.tolist()
+
+    def __len__(self):
+        return len(self.players)
+
+    def sample(self, rng, k):
+        """k autores (com reposição), um uniforme do pool por gol"""
+        n = len(self._prob)
+        if not n: return []
+        out = []
+        for _ in range(k):
+            x = rng.random() * n
+            i = int(x)
+            out.append(self.players[i if x - i < self._prob[i] else self._alias[i]])
+        return out
+
+
+def _build_alias(weights):
+    """Método de Vose: prob[i] = chance de ficar com i; senão vai para alias[i]"""
+    n = len(weights)
+    prob = np.ones(n)
+    alias = np.arange(n)
+    if not n: return prob, alias
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    small = [i for i, s in enumerate(scaled) if s < 1]
+    large = [i for i, s in enumerate(scaled) if s >= 1]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1 - scaled[s]
+        (small if scaled[l] < 1 else large).append(l)
+    # Sobras (erro de ponto flutuante) ficam com probabilidade 1
+    return prob, alias
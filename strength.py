@@ -0,0 +1,91 @@
+import bisect
+import heapq
+
+# --- FORÇA DO ELENCO (AGREGADOS INCREMENTAIS) ---
+# Cada time mantém, por posição, os overalls ordenados. A média dos titulares de cada
+# posição (ex. 4-3-3: Top 1 GK, Top 4 DEF, Top 3 MID, Top 3 ATA) e a força geral do XI ficam
+# em cache e só são recalculadas para a posição que mudou (entrada, saída ou evolução de um jogador).
+# Setor sem gente suficiente é completado pelos melhores reservas das outras posições, como no
+# XI do lineup.py (improvisados), então a força é sempre a média do XI que a UI mostra.
+# Trabalha só com (posição, overall), então o save binário monta a força sem criar os jogadores.
+# É a única fonte da força do time (simulação e UI); o lineup.py só diz QUEM são os titulares.
+
+FORMATIONS = {
+    "4-3-3": {"GK": 1, "DEF": 4, "MID": 3, "ATA": 3},
+    "4-4-2": {"GK": 1, "DEF": 4, "MID": 4, "ATA": 2},
+    "3-5-2": {"GK": 1, "DEF": 3, "MID": 5, "ATA": 2},
+    "5-3-2": {"GK": 1, "DEF": 5, "MID": 3, "ATA": 2},
+    "4-5-1": {"GK": 1, "DEF": 4, "MID": 5, "ATA": 1},
+}
+DEFAULT_FORMATION = "4-3-3"
+STARTER_SLOTS = FORMATIONS[DEFAULT_FORMATION]
+
+
+class TeamStrength:
+    """Recebe pares (posição, overall) do elenco inicial e as vagas por posição da formação"""
+    def __init__(self, entries=(), slots=STARTER_SLOTS):
+        self.slots = slots
+        self._overalls = {pos: [] for pos in STARTER_SLOTS}
+        self._top_sum = dict.fromkeys(STARTER_SLOTS, 0)
+        self._xi = None
+
+        for position, overall in entries:
+            self._overalls[position].append(overall)
+        for pos, vals in self._overalls.items():
+            vals.sort()
+            self._top_sum[pos] = sum(vals[-slots[pos]:])
+        self._refresh_xi()
+
+    def add(self, position, overall):
+        bisect.insort(self._overalls[position], overall)
+        self._refresh(position)
+
+    def remove(self, position, overall):
+        vals = self._overalls[position]
+        del vals[bisect.bisect_left(vals, overall)]
+        self._refresh(position)
+
+    def update(self, position, old, new):
+        """Overall de um jogador mudou (evolução, investimento na base...)"""
+        if old == new: return
+        vals = self._overalls[position]
+        del vals[bisect.bisect_left(vals, old)]
+        bisect.insort(vals, new)
+        self._refresh(position)
+
+    def set_slots(self, slots):
+        """Troca de formação: só as somas dos titulares mudam"""
+        self.slots = slots
+        for pos, vals in self._overalls.items():
+            self._top_sum[pos] = sum(vals[-slots[pos]:])
+        self._refresh_xi()
+
+    def _refresh(self, position):
+        self._top_sum[position] = sum(self._overalls[position][-self.slots[position]:])
+        self._refresh_xi()
+
+    def _refresh_xi(self):
+        filled = sum(min(n, len(self._overalls[pos])) for pos, n in self.slots.items())
+        total = sum(self._top_sum.values())
+        missing = sum(self.slots.values()) - filled
+        if missing > 0:
+            # Improvisados: os `missing` melhores reservas de qualquer posição
+            bench = [v for pos, vals in self._overalls.items()
+                     for v in vals[max(0, len(vals) - self.slots[pos] - missing):max(0, len(vals) - self.slots[pos])]]
+            improvised = heapq.nlargest(missing, bench)
+            filled += len(improvised)
+            total += sum(improvised)
+        self._xi = total / filled if filled else None
+
+    # --- LEITURAS O(1) ---
+
+    def position_avg(self, position):
+        """Média dos titulares naturais da posição (0 se não há jogadores suficientes para o setor)"""
+        n = self.slots[position]
+        if len(self._overalls[position]) < n: return 0
+        return self._top_sum[position] / n
+
+    @property
+    def starting_xi(self):
+        """Média dos titulares na formação (com improvisados, se faltar gente). None para elenco vazio."""
+        return self._xi
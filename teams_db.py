@@ -0,0 +1,147 @@
+import json
+import os
+import hashlib
+
+import numpy as np
+
+# --- CARREGAMENTO COMPILADO DO teams_db.json ---
+# O JSON (gerado pelo db_builder.py) é validado uma única vez e compilado para colunas numpy
+# num .npz ao lado do arquivo. Nas próximas inicializações o cache é reaproveitado enquanto
+# o mtime/tamanho do JSON não mudar; se mudarem, o hash do conteúdo decide se recompila.
+
+TIERS = ("college1", "college2")
+CACHE_VERSION = 1
+
+
+class TeamsDBError(ValueError):
+    """teams_db.json com estrutura inválida (time malformado, duplicado, etc.)"""
+
+
+class TeamsDB:
+    """Times do College em colunas: tier, nome, conferência e rating"""
+    def __init__(self, tier, names, conferences, ratings):
+        self.tier = tier               # np.uint8 (índice em TIERS)
+        self.names = names             # list[str]
+        self.conferences = conferences # list[str]
+        self.ratings = ratings         # np.int16
+
+    def __len__(self):
+        return len(self.names)
+
+    def iter_tier(self, tier_name):
+        """Gera (nome, conferência, rating) dos times de um tier ("college1" ou "college2")"""
+        code = TIERS.index(tier_name)
+        tiers = self.tier.tolist()
+        ratings = self.ratings.tolist()
+        for i, t in enumerate(tiers):
+            if t == code:
+                yield self.names[i], self.conferences[i], ratings[i]
+
+
+def validate_teams_db(data):
+    """Confere o schema do JSON e retorna as colunas. Levanta TeamsDBError no primeiro problema."""
+    if not isinstance(data, dict):
+        raise TeamsDBError("teams_db.json deve ser um objeto com as chaves 'college1' e 'college2'")
+
+    tier, names, conferences, ratings = [], [], [], []
+    for code, tier_name in enumerate(TIERS):
+        teams = data.get(tier_name)
+        if not isinstance(teams, list):
+            raise TeamsDBError(f"'{tier_name}' ausente ou não é uma lista")
+
+        # O mesmo clube pode existir nos dois tiers, mas não duas vezes no mesmo
+        seen = set()
+        for i, team in enumerate(teams):
+            where = f"{tier_name}[{i}]"
+            if not isinstance(team, dict):
+                raise TeamsDBError(f"{where}: time deve ser um objeto")
+            name, conf, rating = team.get("name"), team.get("conference"), team.get("rating")
+            if not isinstance(name, str) or not name.strip():
+                raise TeamsDBError(f"{where}: 'name' inválido ({name!r})")
+            if not isinstance(conf, str) or not conf.strip():
+                raise TeamsDBError(f"{where} ({name}): 'conference' inválida ({conf!r})")
+            if isinstance(rating, bool) or not isinstance(rating, int) or not 1 <= rating <= 99:
+                raise TeamsDBError(f"{where} ({name}): 'rating' deve ser inteiro entre 1 e 99 ({rating!r})")
+            if name in seen:
+                raise TeamsDBError(f"{where}: time duplicado em {tier_name}: {name}")
+            seen.add(name)
+
+            tier.append(code); names.append(name); conferences.append(conf); ratings.append(rating)
+
+    return TeamsDB(np.asarray(tier, dtype=np.uint8), names, conferences, np.asarray(ratings, dtype=np.int16))
+
+
+def _cache_path(path):
+    folder, fname = os.path.split(path)
+    return os.path.join(folder, f".{fname}.cache.npz")
+
+
+def _read_cache(cache_path):
+    try:
+        with np.load(cache_path) as z:
+            meta = json.loads(str(z["meta"]))
+            if meta.get("version") != CACHE_VERSION: return None, None
+            strings = meta["strings"]
+            db = TeamsDB(z["tier"], [strings[i] for i in z["name"].tolist()],
+                         [strings[i] for i in z["conference"].tolist()], z["rating"])
+            return meta, db
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def _write_cache(cache_path, db, mtime_ns, size, digest):
+    strings, index = [], {}
+    def code(s):
+        if s not in index:
+            index[s] = len(strings); strings.append(s)
+        return index[s]
+    name_codes = np.asarray([code(n) for n in db.names], dtype=np.int32)
+    conf_codes = np.asarray([code(c) for c in db.conferences], dtype=np.int32)
+    meta = {"version": CACHE_VERSION, "mtime_ns": mtime_ns, "size": size, "sha1": digest, "strings": strings}
+
+    # Grava num temporário e troca, para uma sessão concorrente nunca ler cache pela metade
+    tmp = cache_path + ".tmp.npz"
+    np.savez(tmp, meta=np.array(json.dumps(meta, ensure_ascii=False)), tier=db.tier,
+             name=name_codes, conference=conf_codes, rating=db.ratings)
+    os.replace(tmp, cache_path)
+
+
+def load_teams_db(path="teams_db.json", use_cache=True):
+    """
+    Retorna o TeamsDB validado.
+    - Arquivo ausente: FileNotFoundError (antes o universo subia sem College, em silêncio).
+    - JSON malformado ou times inválidos/duplicados: TeamsDBError.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} não encontrado. Rode db_builder.py para gerar o banco de times.")
+
+    st_ = os.stat(path)
+    cache_path = _cache_path(path)
+
+    if use_cache:
+        meta, db = _read_cache(cache_path)
+        # Caminho rápido: mesmo mtime e tamanho, nem lê o JSON
+        if db is not None and meta["mtime_ns"] == st_.st_mtime_ns and meta["size"] == st_.st_size:
+            return db
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+
+    if use_cache and db is not None and meta["sha1"] == digest:
+        # Arquivo só foi "tocado": conteúdo igual, atualiza a chave do cache
+        _write_cache(cache_path, db, st_.st_mtime_ns, st_.st_size, digest)
+        return db
+
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise TeamsDBError(f"{path} não é um JSON válido: {e}") from e
+
+    db = validate_teams_db(data)
+    if use_cache:
+        try:
+            _write_cache(cache_path, db, st_.st_mtime_ns, st_.st_size, digest)
+        except OSError:
+            pass # Diretório somente leitura: segue sem cache
+    return db
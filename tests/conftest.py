@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# Módulos ficam na raiz do repositório (layout plano)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from universe import build_universe  # noqa: E402
+
+DB_PATH = os.path.join(ROOT, "teams_db.json")
+
+
+@pytest.fixture
+def engine():
+    """Universo completo (LNF + College do teams_db.json), reproduzível"""
+    return build_universe(DB_PATH, seed=7)
@@ -0,0 +1,20 @@
+import batch
+from conftest import DB_PATH
+
+
+def test_run_career_records_settled_week_52(engine):
+    """Caixa e receita do ano são os de depois do acerto da semana 52, antes da virada zerar a receita"""
+    closing = {}
+    def close(e):
+        closing["budget"] = [t.budget for t in e.teams]
+        closing["revenue"] = [t.revenue for t in e.teams]
+    engine.checkpoints = None
+    engine.simulate_to_week(52)
+    before_week_52 = [t.budget for t in engine.teams]
+    engine.on_season_end = close
+    engine.advance_week(narrative=False)
+
+    r = batch.run_career(7, 1, DB_PATH)
+    assert r["budget"][0].tolist() == closing["budget"] != before_week_52
+    assert r["revenue"][0].tolist() == closing["revenue"]
+    assert any(closing["revenue"])
@@ -0,0 +1,74 @@
+from brackets import COPA_DO_BRASIL, NCP, LNF_CONFERENCE_PLAYOFFS
+from engine import UniFUTEngine
+from savefile import save_binary, load_binary
+
+
+def test_ncp_progression(engine):
+    entrants = engine.rank_college()[:12]
+    state = NCP.run(engine, entrants, with_stats=False)
+
+    assert state.finished
+    assert [len(r.ties) for r in state.results] == [4, 4, 2, 1]
+    assert state.results[0].byes == entrants[:4] # Seeds 1-4 folgam
+    for prev, nxt in zip(state.results, state.results[1:]):
+        alive = set(prev.byes) | {t.winner for t in prev.ties}
+        assert {t for tie in nxt.ties for t in (tie.home, tie.away)} == alive
+    assert state.champion is state.results[-1].ties[0].winner
+
+
+def test_lnf_playoffs_crown_superbowl_winner(engine):
+    engine.simulate_to_week(46)
+
+    final = engine.lnf_playoffs["Super Bowl"]
+    assert final.finished
+    assert engine.lnf_champion is final.champion
+    assert {final.results[0].ties[0].home, final.results[0].ties[0].away} >= {final.champion}
+    # Bowls Regionais da semana 45 ficam guardados para a UI
+    assert [b["Bowl"] for b in engine.last_bowls] == ["North Star Bowl", "Caldeirão Bowl", "Coffee Bowl", "Oceanic Bowl"]
+
+
+def test_conference_bracket_reseeds(engine):
+    seeds = engine._lnf_playoff_seeds()["Brasileira"]
+    state = LNF_CONFERENCE_PLAYOFFS.run(engine, seeds, with_stats=False)
+    wild_card, divisional = state.results[0], state.results[1]
+
+    assert wild_card.byes == [seeds[0]]
+    assert [(t.home, t.away) for t in wild_card.ties] == [(seeds[1], seeds[6]), (seeds[2], seeds[5]), (seeds[3], seeds[4])]
+    # Seed 1 recebe o pior classificado que sobrou
+    survivors = sorted({t.winner for t in wild_card.ties}, key=seeds.index)
+    assert divisional.ties[0].home is seeds[0] and divisional.ties[0].away is survivors[-1]
+
+
+def _season_champion(engine):
+    start = len(engine.history)
+    engine.simulate_to_week(1)
+    return engine.history_rows(start)[0]
+
+
+def test_save_mid_playoffs_keeps_brackets(engine, tmp_path):
+    engine.simulate_to_week(42) # Divisional jogado, Final de Conferência a agendar
+    state = engine.playoff_state()
+    path = tmp_path / "meio_playoffs.unifut"
+    save_binary(engine, path)
+
+    for loaded in (load_binary(path), UniFUTEngine.load_from_json(engine.to_json())):
+        assert loaded.playoff_state() == state
+        assert loaded.cup_champions["Copa do Brasil"].id == engine.cup_champions["Copa do Brasil"].id
+        row = _season_champion(loaded)
+        assert row["LNF Campeão"] == loaded.lnf_champion.name
+        assert row["Copa do Brasil"] == engine.cup_champions["Copa do Brasil"].name
+
+
+def test_copa_lnf_entrants_play_fase_3(engine):
+    entrants, joins, seeds = engine._copa_brasil_entrants()
+    cup = COPA_DO_BRASIL.run(engine, entrants, joins=joins, seed_order=seeds, with_stats=False)
+    fase3 = cup.results[2]
+    played = {t for tie in fase3.ties for t in (tie.home, tie.away)}
+
+    assert set(joins["lnf"]) <= played # Rodada de entrada da LNF: todos jogam
+    assert len(fase3.byes) == 24 and all("College" in t.league for t in fase3.byes)
+    # As folgas são os melhores seeds do College ainda vivos
+    college_alive = sorted((t for t in played | set(fase3.byes) if "College" in t.league), key=seeds.index)
+    assert set(fase3.byes) == set(college_alive[:24])
+    # Seeds LNF só aparecem nas Oitavas
+    assert not set(joins["seeds"]) & {t for r in cup.results[:6] for tie in r.ties for t in (tie.home, tie.away)}
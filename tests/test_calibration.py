@@ -0,0 +1,31 @@
+import numpy as np
+
+import calibration
+
+
+def test_goal_rate_matches_engine(engine):
+    """A calibragem e o simulate_ties fazem a mesma conta: mesmas taxas nos mesmos confrontos"""
+    teams = engine.get_teams_by_league("LNF")
+    for t in teams: t.coach = None # Sem duelo tático dos dois lados
+    pairs = [(a, b) for a in teams for b in teams if a is not b]
+    grid = (np.array([a.strength for a, _ in pairs]), np.array([b.strength for _, b in pairs]))
+
+    rounds = 200_000 // len(pairs)
+    goals = np.array(engine.simulate_ties(pairs * rounds, is_knockout=False, with_stats=False))
+    engine_goals = goals.sum(axis=1).mean()
+    engine_home = (goals[:, 0] > goals[:, 1]).mean()
+
+    metrics = calibration.simulate({}, len(pairs) * rounds, seed=11, grid=grid, tactics=False).metrics()
+    assert abs(metrics["goals"] - engine_goals) < 0.03
+    assert abs(metrics["home"] - engine_home) < 0.01
+
+
+def test_knockout_matrix_matches_simulate_ties(engine):
+    """Projeção e jogo real usam o mesmo modelo, inclusive quando só um lado tem técnico"""
+    home, away = engine.get_teams_by_league("LNF")[:2]
+    home.coach.style, away.coach = "Contra-Ataque", None
+    p = engine.knockout_matrix([home, away])[0, 1]
+
+    n = 200_000
+    goals = np.array(engine.simulate_ties([(home, away)] * n, is_knockout=True, with_stats=False))
+    assert abs((goals[:, 0] > goals[:, 1]).mean() - p) < 0.005
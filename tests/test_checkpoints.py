@@ -0,0 +1,35 @@
+import pytest
+
+
+def fingerprint(engine):
+    """Tudo o que uma semana mexe: tabela, caixa, elencos, jogadores, calendário, histórico e campeões"""
+    return (engine.season_year, engine.current_week,
+            [(t.wins, t.points, t.goals_for, t.budget, t.revenue, t.payroll, t.strength, [p.id for p in t.players])
+             for t in engine.teams],
+            [(p.id, p.age, p.overall, p.potential, p.goals, p.matches, p.wage, p.contract_years, p.team_id)
+             for t in engine.teams for p in t.players],
+            len(engine.ledger), engine.ledger.totals.sum(), sorted(engine.goal_events), len(engine.players),
+            [(m.id, m.played, m.home_score, m.away_score) for m in engine.calendar.matches],
+            engine.history_rows(0), engine.playoff_state(),
+            {k: t.id for k, t in engine.cup_champions.items() if t}, [d["Jogador"] for d in engine.last_draft])
+
+
+# Semanas comuns, final da Copa (17), Draft (48) e virada de ano (52 -> 1)
+@pytest.mark.parametrize("start, weeks", [(5, 3), (15, 4), (46, 4), (50, 4)])
+def test_undo_restores_and_replay_is_deterministic(engine, start, weeks):
+    engine.set_user_team(engine.get_teams_by_league("LNF")[0].id)
+    engine.simulate_to_week(start)
+    before = fingerprint(engine)
+    for _ in range(weeks): engine.advance_week(narrative=False)
+    after = fingerprint(engine)
+
+    assert engine.undo_weeks(weeks)[1] == start
+    assert fingerprint(engine) == before
+    for _ in range(weeks): engine.advance_week(narrative=False)
+    assert fingerprint(engine) == after
+
+
+def test_undo_beyond_ring_fails(engine):
+    engine.simulate_to_week(3)
+    with pytest.raises(ValueError):
+        engine.undo_weeks(engine.checkpoints.depth + 1)
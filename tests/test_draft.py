@@ -0,0 +1,45 @@
+from draft import (ROUNDS, DRAFT_FEES, ROSTER_LIMIT, MAX_PROSPECT_AGE, BPA,
+                   ProspectPool, draft_order, projected_overalls)
+from ledger import DRAFT
+
+
+def test_projection_grows_with_youth():
+    proj = projected_overalls([60, 60, 60, 70], [80, 80, 80, 65], [17, 20, 23, 18])
+    assert proj.tolist() == [80, 73, 63, 70] # Sem regressão para quem já passou do potencial
+
+
+def test_pool_pops_in_value_order(engine):
+    players = [p for t in engine.get_teams_by_league("College") for p in t.players if p.age <= MAX_PROSPECT_AGE]
+    pool = ProspectPool(players)
+    values = []
+    while len(pool) > len(players) - 50:
+        best = pool.best()
+        assert pool.best(best.position) is best # Topo geral também é o topo da posição
+        values.append(pool.values[best.id])
+        pool.take(best)
+    assert values == sorted(values, reverse=True)
+    assert [pool.values[p.id] for p, _ in pool.ranking(5)] == [v for _, v in pool.ranking(5)]
+    assert pool.ranking(1)[0][0] is pool.best()
+
+
+def test_run_draft(engine):
+    engine.simulate_to_week(48)
+    lnf = engine.get_teams_by_league("LNF")
+    order = [t.id for t in draft_order(lnf)]
+    college_sizes = {t.id: len(t.players) for t in engine.get_teams_by_league("College")}
+    fees_before = engine.ledger.totals[DRAFT].copy()
+
+    picks = engine.run_draft()
+    assert len(picks) == ROUNDS * len(lnf)
+    for rnd in range(1, ROUNDS + 1):
+        assert [p["club_id"] for p in picks if p["Rodada"] == rnd] == order # Pior campanha escolhe primeiro
+    assert all(engine.teams[p["origin_id"]].name == p["Origem"] and "College" in engine.teams[p["origin_id"]].league
+               for p in picks)
+    assert all(len(t.players) <= ROSTER_LIMIT for t in lnf)
+    # Cada draftado volta como calouro: o College mantém o tamanho do elenco
+    assert {t.id: len(t.players) for t in engine.get_teams_by_league("College")} == college_sizes
+
+    paid = engine.ledger.totals[DRAFT] - fees_before
+    assert paid.sum() == 0 # Dinheiro só muda de mão
+    assert -paid[[t.id for t in lnf]].sum() == len(lnf) * sum(DRAFT_FEES)
+    assert any(p["Política"] == BPA for p in picks)
@@ -0,0 +1,89 @@
+import numpy as np
+
+from engine import Player
+from ledger import Ledger, CATEGORY_NAMES, TICKETS, TV, WAGES, TRANSFER, REVENUE_CATEGORIES
+
+
+def recomputed(ledger, size):
+    """Agregados refeitos do zero a partir das linhas do livro"""
+    e = ledger.entries
+    totals = np.zeros((len(CATEGORY_NAMES), size), dtype=np.int64)
+    seasons = {}
+    for year, team, category, amount in zip(e["year"].tolist(), e["team"].tolist(), e["category"].tolist(),
+                                            e["amount"].tolist()):
+        totals[category, team] += amount
+        seasons.setdefault(year, np.zeros_like(totals))[category, team] += amount
+    return totals, seasons
+
+
+def same_table(table, expected):
+    """Tabelas só crescem até o maior id lançado: o que falta conta como zero"""
+    width = max(table.shape[1], expected.shape[1])
+    pad = lambda t: np.pad(t, ((0, 0), (0, width - t.shape[1])))
+    return np.array_equal(pad(table), pad(expected))
+
+
+def assert_aggregates_match(ledger, size):
+    totals, seasons = recomputed(ledger, size)
+    assert same_table(ledger.totals, totals)
+    assert sorted(ledger.seasons) == sorted(seasons)
+    for year, table in seasons.items():
+        assert same_table(ledger.seasons[year], table)
+
+
+def test_aggregates_follow_rows(engine):
+    teams = engine.teams
+    n = len(teams) # Mais times que a capacidade inicial das tabelas (64)
+    ledger = Ledger()
+    budgets = [t.budget for t in teams]
+    revenues = [t.revenue for t in teams]
+
+    ledger.post(2026, 1, teams[0], 1_000, TICKETS)
+    ledger.post(2026, 1, teams[n - 1], -500, WAGES)
+    ledger.transfer(2026, 2, teams[3], teams[70], 2_000, TRANSFER, ref=5)
+    ids = np.arange(n)
+    ledger.post_many(2026, 3, teams, ids, ids * 10, TV)
+    after_2026 = len(ledger)
+    ledger.post_many(2027, 1, teams, ids[::2], -ids[::2], WAGES, counterparties=1)
+    ledger.post(2027, 2, teams[5], 300, TICKETS)
+    assert_aggregates_match(ledger, n)
+
+    # Caixa e receita acompanham as linhas
+    e = ledger.entries
+    delta = np.bincount(e["team"], weights=e["amount"], minlength=n).astype(np.int64)
+    revenue = (e["amount"] > 0) & np.isin(e["category"], list(REVENUE_CATEGORIES))
+    rev_delta = np.bincount(e["team"][revenue], weights=e["amount"][revenue], minlength=n).astype(np.int64)
+    assert [t.budget for t in teams] == (np.array(budgets) + delta).tolist()
+    assert [t.revenue for t in teams] == (np.array(revenues) + rev_delta).tolist()
+
+    ledger.truncate(len(ledger) - 1) # Dentro de 2027
+    assert_aggregates_match(ledger, n)
+    ledger.truncate(after_2026 - 4) # Volta para 2026: a temporada 2027 some
+    assert 2027 not in ledger.seasons
+    assert_aggregates_match(ledger, n)
+
+    reloaded = Ledger.from_arrays(ledger.to_arrays())
+    assert_aggregates_match(reloaded, n)
+
+    ledger.truncate(0)
+    assert len(ledger) == 0 and not ledger.seasons and not ledger.totals.any()
+
+
+def test_payroll_follows_wages(engine):
+    team = engine.teams[0]
+    def assert_payroll(): assert team.payroll == sum(p.wage for p in team.players)
+
+    assert_payroll()
+    team.players[0].wage += 12_345
+    assert_payroll()
+    newcomer = Player("Reforço", "ATA", 24, 75)
+    team.add_player(newcomer)
+    assert_payroll()
+    newcomer.wage *= 2
+    assert_payroll()
+    leaving = team.players[1]
+    team.remove_player(leaving)
+    leaving.wage += 1_000 # Fora do elenco: não mexe mais na folha
+    assert_payroll()
+    team.remove_player(newcomer)
+    assert_payroll()
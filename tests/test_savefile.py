@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from engine import Player
+from savefile import FORMAT_VERSION, save_binary, load_binary, dump_binary
+
+
+def test_lookup_of_player_outside_rosters_stays_lazy(engine, tmp_path):
+    engine.fast_forward(1) # Aposentados deixam ids sem elenco no save
+    save_binary(engine, tmp_path / "carreira.unifut")
+    loaded = load_binary(tmp_path / "carreira.unifut")
+
+    retired = int(np.flatnonzero(loaded._lazy_player_teams < 0)[0])
+    p = loaded.get_player(retired)
+    original = engine.players[retired]
+    assert (p.id, p.name, p.age, p.goals, p.team_id) == (original.id, original.name, original.age, original.goals, -1)
+    assert all(t._players_loader is not None for t in loaded.teams)
+
+
+def test_registry_ids_are_not_reused(engine, tmp_path):
+    engine.fast_forward(1)
+    newest = engine.players[-1]
+    engine.teams[newest.team_id].remove_player(newest) # O id mais alto fica sem elenco
+    save_binary(engine, tmp_path / "carreira.unifut")
+    loaded = load_binary(tmp_path / "carreira.unifut")
+
+    assert len(loaded.players) == len(engine.players)
+    assert loaded.get_player(newest.id).name == newest.name
+    regen = loaded.register_player(Player("Novo", "ATA", 18, 60))
+    assert regen.id == len(engine.players)
+
+
+TEAM_ATTRS = ("name", "league", "conference", "division", "rating", "budget", "payroll", "revenue", "salary_cap",
+              "is_human", "stadium_level", "training_level", "youth_level", "formation", "next_tactic",
+              "wins", "losses", "draws", "points", "goals_for", "goals_against")
+PLAYER_ATTRS = ("id", "name", "position", "age", "overall", "potential", "contract_years", "market_value", "wage",
+                "goals", "assists", "matches", "mvp_points", "last_evolution")
+
+
+def snapshot(engine):
+    """Estado comparável da carreira (times, elencos, técnicos, calendário, gols, histórico e caixa)"""
+    teams = [(tuple(getattr(t, a) for a in TEAM_ATTRS), (t.coach.name, t.coach.style, t.coach.age) if t.coach else None,
+              t.strength, [tuple(getattr(p, a) for a in PLAYER_ATTRS) for p in t.players]) for t in engine.teams]
+    calendar = [(m.id, m.week, m.home_team.id, m.away_team.id, m.competition, m.played, m.home_score, m.away_score)
+                for m in engine.calendar.matches]
+    history = {k: v.tolist() for k, v in engine.history.to_arrays().items()}
+    ledger = {k: v.tolist() for k, v in engine.ledger.to_arrays().items()}
+    return (engine.season_year, engine.current_week, teams, calendar, sorted(engine.goal_events), history, ledger)
+
+
+def test_binary_round_trip(engine, tmp_path):
+    engine.fast_forward(1)
+    engine.simulate_to_week(20) # Temporada em andamento: jogos, gols e caixa da semana
+    path = tmp_path / "carreira.unifut"
+    save_binary(engine, path)
+    loaded = load_binary(path)
+
+    assert [t.strength for t in loaded.teams] == [t.strength for t in engine.teams] # Ainda sem materializar
+    assert snapshot(loaded) == snapshot(engine)
+    assert dump_binary(loaded) == dump_binary(engine) # Salvar de novo dá os mesmos bytes
+
+
+def test_other_format_versions_are_rejected(engine, tmp_path):
+    data = dump_binary(engine)
+    header_len = int(np.frombuffer(data[8:12], dtype=np.uint32)[0])
+    header = data[12:12 + header_len].replace(b'"version": %d' % FORMAT_VERSION, b'"version": 1')
+    path = tmp_path / "antigo.unifut"
+    path.write_bytes(data[:12] + header + data[12 + header_len:])
+    with pytest.raises(ValueError, match="Versão de save não suportada: 1"):
+        load_binary(path)
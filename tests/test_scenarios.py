@@ -0,0 +1,9 @@
+def test_sell_player_who_already_left(engine):
+    team = engine.teams[0]
+    star = team.players[0]
+    team.remove_player(star) # Saiu antes de a decisão ser tomada
+    budget, entries = team.budget, len(engine.ledger)
+    for player_id in (star.id, len(engine.players) + 10): # Fora do elenco / id que não resolve mais
+        msg = engine.apply_event_effect(team, {"type": "sell_player", "player_id": player_id, "value": 1_000_000})
+        assert msg == "O jogador já não estava mais no elenco (Bug de tempo)."
+    assert team.budget == budget and len(engine.ledger) == entries
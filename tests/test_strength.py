@@ -0,0 +1,41 @@
+from strength import TeamStrength, FORMATIONS
+
+
+def xi_avg(team):
+    xi = team.starters
+    return sum(p.overall for p in xi) / len(xi)
+
+
+def test_strength_matches_lineup_after_changes(engine):
+    team = next(t for t in engine.teams if t.league == "LNF")
+    assert team.strength == xi_avg(team)
+    team.formation = "3-5-2"
+    assert team.strength == xi_avg(team)
+    star = max(team.players, key=lambda p: p.overall)
+    star.overall -= 15
+    team.remove_player(team.starters[-1])
+    assert team.strength == xi_avg(team)
+
+
+def test_rebuild_matches_incremental():
+    entries = [("GK", 70), ("GK", 75)] + [("DEF", 60 + i) for i in range(6)] \
+        + [("MID", 65 + i) for i in range(5)] + [("ATA", 72), ("ATA", 80), ("ATA", 68)]
+    live = TeamStrength(entries[:5])
+    for pos, ovr in entries[5:]: live.add(pos, ovr)
+    live.update("ATA", 80, 84)
+    live.set_slots(FORMATIONS["4-4-2"])
+    rebuilt = TeamStrength([e if e != ("ATA", 80) else ("ATA", 84) for e in entries], FORMATIONS["4-4-2"])
+    assert live.starting_xi == rebuilt.starting_xi
+    assert live.position_avg("MID") == rebuilt.position_avg("MID")
+
+
+def test_short_position_uses_improvised_xi(engine):
+    team = next(t for t in engine.teams if t.league == "LNF")
+    for p in [p for p in team.players if p.position == "DEF"][2:]: # Sobram 2 zagueiros para 4 vagas
+        team.remove_player(p)
+    assert sum(p.position == "DEF" for p in team.starters) == 2 and len(team.starters) == 11
+    assert team.strength == xi_avg(team)
+    team.formation = "5-3-2"
+    assert team.strength == xi_avg(team)
+    rebuilt = TeamStrength([(p.position, p.overall) for p in team.players], FORMATIONS["5-3-2"])
+    assert rebuilt.starting_xi == team.strength
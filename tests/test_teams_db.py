@@ -0,0 +1,61 @@
+import json
+import os
+
+import pytest
+
+from teams_db import TeamsDBError, load_teams_db, validate_teams_db, _cache_path
+
+
+def team(name, rating=70, conference="Sudeste"):
+    return {"name": name, "conference": conference, "rating": rating}
+
+
+def write_db(path, college1, college2=()):
+    path.write_text(json.dumps({"college1": list(college1), "college2": list(college2)}), encoding="utf-8")
+    return str(path)
+
+
+def test_validation_columns():
+    db = validate_teams_db({"college1": [team("Ipatinga", 72)], "college2": [team("Ipatinga", 60), team("Tupi", 58)]})
+    assert len(db) == 3
+    assert list(db.iter_tier("college2")) == [("Ipatinga", "Sudeste", 60), ("Tupi", "Sudeste", 58)]
+
+
+@pytest.mark.parametrize("data, message", [
+    ([], "objeto"),
+    ({"college1": []}, "'college2'"),
+    ({"college1": [team("Tupi"), team("Tupi")], "college2": []}, "duplicado"),
+    ({"college1": [team("Tupi", rating=100)], "college2": []}, "'rating'"),
+    ({"college1": [team("Tupi", rating=True)], "college2": []}, "'rating'"),
+    ({"college1": [team("Tupi", conference="")], "college2": []}, "'conference'"),
+    ({"college1": [{"conference": "Sul", "rating": 70}], "college2": []}, "'name'"),
+])
+def test_validation_rejects(data, message):
+    with pytest.raises(TeamsDBError, match=message):
+        validate_teams_db(data)
+
+
+def test_missing_and_malformed_files(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_teams_db(str(tmp_path / "nada.json"))
+    bad = tmp_path / "teams_db.json"
+    bad.write_text("{college1: [", encoding="utf-8")
+    with pytest.raises(TeamsDBError, match="JSON"):
+        load_teams_db(str(bad))
+
+
+def test_cache_reused_until_content_changes(tmp_path):
+    path = write_db(tmp_path / "teams_db.json", [team("Tupi")])
+    assert load_teams_db(path).names == ["Tupi"]
+    assert os.path.exists(_cache_path(path))
+
+    # Mesmo mtime e tamanho: o JSON nem é lido (conteúdo trocado por baixo não aparece)
+    stat = os.stat(path)
+    write_db(tmp_path / "teams_db.json", [team("Tupy")])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_teams_db(path).names == ["Tupi"]
+
+    # mtime novo e conteúdo novo: recompila
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_teams_db(path).names == ["Tupy"]
+    assert load_teams_db(path, use_cache=False).names == ["Tupy"]
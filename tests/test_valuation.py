@@ -0,0 +1,32 @@
+import numpy as np
+
+from valuation import market_value, market_values, wage, wages
+
+
+def original_value(overall, age):
+    """Fórmula de antes das tabelas (Player._calculate_value)"""
+    base = overall ** 3.5
+    age_factor = 1.0 if 22 <= age <= 32 else (1.5 if age < 22 else 0.6)
+    return int(base * 0.5 * age_factor)
+
+
+def original_wage(overall):
+    return int((overall ** 3) * 12)
+
+
+# Passa dos dois lados da faixa tabelada (40-99): abaixo e acima caem na fórmula direta
+OVERALLS = range(30, 110)
+AGES = range(14, 45)
+
+
+def test_scalar_lookups_match_original_formulas():
+    for o in OVERALLS:
+        assert wage(o) == original_wage(o)
+        for a in AGES:
+            assert market_value(o, a) == original_value(o, a)
+
+
+def test_vectorized_lookups_match_original_formulas():
+    overall, age = (g.ravel() for g in np.meshgrid(np.array(OVERALLS), np.array(AGES)))
+    assert market_values(overall, age).tolist() == [original_value(o, a) for o, a in zip(overall.tolist(), age.tolist())]
+    assert wages(overall).tolist() == [original_wage(o) for o in overall.tolist()]
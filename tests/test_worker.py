@@ -0,0 +1,34 @@
+import threading
+import time
+
+from worker import SimulationWorker
+
+
+def test_stop_cancels_jobs_and_joins_thread(engine):
+    worker = SimulationWorker(engine)
+    running = worker.fast_forward(3)
+    queued = worker.simulate_to_week(10)
+    worker.stop(timeout=60)
+    assert not worker._thread.is_alive()
+    assert running.status == "cancelled" and queued.status == "cancelled"
+    assert engine.lock.acquire(blocking=False) # Nada ficou segurando o lock da Engine
+    engine.lock.release()
+
+
+def test_lock_is_free_between_weeks_of_a_job(engine):
+    worker = SimulationWorker(engine)
+    job = worker.fast_forward(2)
+    while job.done < 2 and not job.finished: time.sleep(0.01)
+
+    def grab():
+        # Como o script da UI de outra sessão: entra entre duas semanas do job
+        if engine.lock.acquire(timeout=10):
+            acquired.append(job.finished)
+            engine.lock.release()
+
+    acquired = []
+    other = threading.Thread(target=grab)
+    other.start()
+    other.join()
+    assert acquired == [False] # Conseguiu o lock com o avanço ainda em andamento
+    worker.stop(timeout=60)
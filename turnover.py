@@ -0,0 +1,49 @@
+import numpy as np
+
+# --- VIRADA DE ANO VETORIZADA ---
+# Mesmas regras do Player.evolve e do ciclo de aposentadoria/regens, só que sobre arrays com
+# um elemento por jogador do universo. A Engine junta as colunas, chama estas funções e
+# devolve os resultados para os objetos (ver UniFUTEngine.advance_season).
+
+
+def evolution_growth(age, overall, potential, matches, goals, assists, training_level, roll):
+    """
+    Ganho/perda de overall de cada jogador (mesma tabela do Player.evolve).
+    roll: inteiros sorteados em [0, 100].
+    """
+    # 1. Fator Idade
+    base_chance = np.select([age < 24, age <= 30], [60, 20], -30)
+
+    # 2. Fator Performance
+    performance_xp = matches * 2 + goals * 3 + assists * 2
+    base_chance = (base_chance + 10 * (matches > 10) + 15 * (matches > 20)
+                   + 20 * (performance_xp > 50))
+
+    # 3. Fator Infraestrutura (+3 por nível de CT) e 4. Fator Potencial
+    base_chance = base_chance + training_level * 3 - 40 * (overall >= potential)
+
+    r = roll + base_chance / 2
+    return np.select(
+        [r > 95, r > 80, r > 50, (r < 20) & (age > 30), (r < 5) & (age > 32)],
+        [3, 2, 1, -1, -2], 0)
+
+
+def retirement_mask(age, roll):
+    """Quem se aposenta (idade já atualizada). roll: inteiros em [0, 100]."""
+    chance = np.where(age > 32, (age - 32) * 10, 0)
+    return roll < chance
+
+
+def regen_overalls(youth_level, u):
+    """Overall dos regens pela Academia (Lv1: 42-57, Lv10: 60-80). u: uniformes em [0, 1)."""
+    min_ovr = 40 + youth_level * 2
+    max_ovr = 55 + youth_level * 2.5
+    return (min_ovr + (max_ovr - min_ovr) * u).astype(np.int64)
+
+
+def regen_potentials(age, overall, gen):
+    """Potencial inicial (mesma regra do construtor do Player)"""
+    young = age < 23
+    bonus = np.where(young, gen.integers(5, 16, len(age)), gen.integers(0, 4, len(age)))
+    return overall + bonus
+
@@ -0,0 +1,50 @@
+from engine import UniFUTEngine, Team
+from teams_db import load_teams_db
+
+# --- MONTAGEM DO UNIVERSO ---
+# LNF fixa (32 clubes, conforme o PDF) + College do teams_db.json. Usado pela UI (app.py) e
+# pelo runner em lote (batch.py), então as duas pontas simulam exatamente o mesmo mundo.
+
+# (nome, conferência, divisão, rating)
+LNF_TEAMS = [
+    ("Flamengo", "Brasileira", "Leste", 92), ("Bahia", "Brasileira", "Leste", 85),
+    ("Atlético-MG", "Brasileira", "Leste", 89), ("Athletico-PR", "Brasileira", "Leste", 86),
+    ("Corinthians", "Brasileira", "Oeste", 88), ("Vitória", "Brasileira", "Oeste", 82),
+    ("Cuiabá", "Brasileira", "Oeste", 83), ("Juventude", "Brasileira", "Oeste", 81),
+    ("Botafogo", "Brasileira", "Norte", 90), ("Ceará", "Brasileira", "Norte", 84),
+    ("Remo", "Brasileira", "Norte", 78), ("Chapecoense", "Brasileira", "Norte", 79),
+    ("Palmeiras", "Brasileira", "Sul", 93), ("Fortaleza", "Brasileira", "Sul", 88),
+    ("Ponte Preta", "Brasileira", "Sul", 77), ("Paysandu", "Brasileira", "Sul", 78),
+    ("São Paulo", "Nacional", "Leste", 89), ("Grêmio", "Nacional", "Leste", 87),
+    ("Criciúma", "Nacional", "Leste", 80), ("Atlético-GO", "Nacional", "Leste", 81),
+    ("Fluminense", "Nacional", "Oeste", 86), ("Sport", "Nacional", "Oeste", 83),
+    ("Guarani", "Nacional", "Oeste", 76), ("Coritiba", "Nacional", "Oeste", 82),
+    ("Internacional", "Nacional", "Norte", 88), ("RB Bragantino", "Nacional", "Norte", 85),
+    ("Goiás", "Nacional", "Norte", 82), ("Avaí", "Nacional", "Norte", 79),
+    ("Vasco", "Nacional", "Sul", 86), ("Cruzeiro", "Nacional", "Sul", 88),
+    ("América-MG", "Nacional", "Sul", 81), ("Santos", "Nacional", "Sul", 87)
+]
+
+
+def build_universe(db_path="teams_db.json", seed=None):
+    """
+    Engine pronta para jogar: times, elencos, técnicos, economia e calendário da 1ª temporada.
+    Com `seed`, o universo inteiro (e a carreira que sair dele) é reproduzível.
+    Sem o teams_db não existe College: FileNotFoundError/TeamsDBError, em vez de um universo incompleto.
+    """
+    db = load_teams_db(db_path)
+    engine = UniFUTEngine()
+    if seed is not None: engine.seed(seed)
+
+    for name, conf, div, rating in LNF_TEAMS:
+        engine.add_team(Team(name, "LNF", conf, div, rating))
+    for name, conf, rating in db.iter_tier("college1"):
+        engine.add_team(Team(name, "College 1", "College", conf, rating))
+    for name, conf, rating in db.iter_tier("college2"):
+        engine.add_team(Team(name, "College 2", "College", conf, rating))
+
+    engine.generate_rosters()
+    engine.generate_coaches()
+    engine.initialize_economy()
+    engine.generate_full_calendar()
+    return engine
@@ -0,0 +1,71 @@
+import numpy as np
+
+# --- TABELAS DE VALOR DE MERCADO E SALÁRIO ---
+# Overall é limitado a 40-99 e a idade só entra por faixa (jovem / auge / veterano), então
+# valor e salário cabem em tabelas pequenas, calculadas uma vez com as mesmas fórmulas de
+# sempre (paridade exata). Fora da faixa de overall (ex: bônus de evento passando de 99)
+# cai na fórmula direta.
+
+OVR_MIN, OVR_MAX = 40, 99
+
+# Faixas de idade: 0 = jovem (< 22), 1 = auge (22-32), 2 = veterano (> 32)
+AGE_FACTORS = (1.5, 1.0, 0.6)
+
+
+def age_band(age):
+    if age < 22: return 0
+    return 1 if age <= 32 else 2
+
+
+def _value_formula(overall, age):
+    return int(overall ** 3.5 * 0.5 * AGE_FACTORS[age_band(age)])
+
+
+def _wage_formula(overall):
+    return int((overall ** 3) * 12)
+
+
+_OVERALLS = range(OVR_MIN, OVR_MAX + 1)
+_BAND_AGE = (21, 22, 33) # Uma idade representativa de cada faixa
+VALUE_TABLE = np.array([[_value_formula(o, a) for o in _OVERALLS] for a in _BAND_AGE], dtype=np.int64)
+WAGE_TABLE = np.array([_wage_formula(o) for o in _OVERALLS], dtype=np.int64)
+# Listas para o caminho escalar (indexar numpy escalar é lento)
+_VALUES = VALUE_TABLE.tolist()
+_WAGES = WAGE_TABLE.tolist()
+
+
+def market_value(overall, age):
+    if OVR_MIN <= overall <= OVR_MAX:
+        return _VALUES[age_band(age)][overall - OVR_MIN]
+    return _value_formula(overall, age)
+
+
+def wage(overall):
+    if OVR_MIN <= overall <= OVR_MAX:
+        return _WAGES[overall - OVR_MIN]
+    return _wage_formula(overall)
+
+
+def age_bands(age):
+    return np.where(age < 22, 0, np.where(age <= 32, 1, 2))
+
+
+def market_values(overall, age):
+    """Valor de mercado de vários jogadores de uma vez (arrays de overall e idade)"""
+    overall = np.asarray(overall, dtype=np.int64)
+    age = np.asarray(age, dtype=np.int64)
+    idx = np.clip(overall, OVR_MIN, OVR_MAX) - OVR_MIN
+    values = VALUE_TABLE[age_bands(age), idx]
+    out = (overall < OVR_MIN) | (overall > OVR_MAX)
+    if out.any():
+        values[out] = [_value_formula(o, a) for o, a in zip(overall[out].tolist(), age[out].tolist())]
+    return values
+
+
+def wages(overall):
+    overall = np.asarray(overall, dtype=np.int64)
+    values = WAGE_TABLE[np.clip(overall, OVR_MIN, OVR_MAX) - OVR_MIN]
+    out = (overall < OVR_MIN) | (overall > OVR_MAX)
+    if out.any():
+        values[out] = [_wage_formula(o) for o in overall[out].tolist()]
+    return values
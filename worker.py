@@ -0,0 +1,126 @@
+import itertools
+import queue
+import threading
+
+# --- WORKER DE SIMULAÇÃO EM SEGUNDO PLANO ---
+# O script do Streamlit roda de cima a baixo a cada interação; uma simulação longa ali dentro
+# congela a página inteira. Cada sessão ganha um SimulationWorker: uma thread com fila de jobs
+# que roda as operações pesadas (avanço rápido, simular até a semana X, projeções) fora do script.
+# A UI só lê o Job (progresso, últimos logs, resultado) e pode pedir o cancelamento.
+# O lock é o da Engine (engine.lock), não do worker: a mesma Engine pode estar em várias sessões,
+# e o script da UI segura o mesmo lock quando altera a Engine. Os jobs não seguram o lock inteiro:
+# a Engine o toma a cada semana (_run_weeks) ou só na cópia do estado (projeções), então um
+# avanço de várias temporadas não trava a página. Trocar de Engine (load) para o worker antigo
+# com stop() antes de criar o novo.
+
+MAX_JOB_LOGS = 200 # Logs parciais guardados por job (os mais recentes)
+
+_job_ids = itertools.count(1)
+
+
+class Job:
+    def __init__(self, name, fn, kind=None):
+        self.id = next(_job_ids)
+        self.name = name
+        self.kind = kind # Para a UI saber o que fazer com o resultado
+        self.fn = fn # fn(engine, job) -> resultado
+        self.status = "queued" # queued | running | done | cancelled | failed
+        self.done = 0
+        self.total = 0
+        self.logs = []
+        self.result = None
+        self.error = None
+        self._cancel = threading.Event()
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 0.0
+
+    @property
+    def finished(self):
+        return self.status in ("done", "cancelled", "failed")
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def report(self, done, total, logs=()):
+        """Callback de progresso (mesma assinatura do on_progress da Engine)"""
+        self.done = done
+        self.total = total
+        if logs:
+            self.logs.extend(logs)
+            del self.logs[:-MAX_JOB_LOGS]
+
+
+class SimulationWorker:
+    def __init__(self, engine):
+        self.engine = engine
+        self.jobs = queue.Queue()
+        self.current = None
+        self.last = None
+        self._thread = threading.Thread(target=self._loop, name="unifut-sim", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self):
+        # unfinished_tasks cobre tanto os jobs na fila quanto o que está rodando
+        return self.jobs.unfinished_tasks > 0
+
+    def submit(self, name, fn, kind=None):
+        job = Job(name, fn, kind)
+        self.jobs.put(job)
+        return job
+
+    def stop(self, timeout=None):
+        """Cancela o job atual e os da fila e encerra a thread (espera a semana em andamento terminar)"""
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            job.cancel()
+            job.status = "cancelled"
+            self.jobs.task_done()
+        job = self.current
+        if job is not None: job.cancel()
+        self.jobs.put(None) # Sentinela: fim do laço
+        self._thread.join(timeout)
+
+    def _loop(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.task_done()
+                return
+            self.current = job
+            if job.cancel_requested:
+                job.status = "cancelled"
+            else:
+                job.status = "running"
+                try:
+                    job.result = job.fn(self.engine, job)
+                    job.status = "cancelled" if job.cancel_requested else "done"
+                except Exception as e: # O erro vai para a UI em vez de matar a thread
+                    job.error = e
+                    job.status = "failed"
+            self.last = job
+            self.current = None
+            self.jobs.task_done()
+
+    # --- JOBS PRONTOS ---
+
+    def fast_forward(self, seasons):
+        return self.submit(f"Avançar {seasons} temporada(s)", lambda engine, job: engine.fast_forward(
+            seasons, on_progress=job.report, should_stop=lambda: job.cancel_requested), kind="seasons")
+
+    def simulate_to_week(self, week):
+        return self.submit(f"Simular até a semana {week}", lambda engine, job: engine.simulate_to_week(
+            week, on_progress=job.report, should_stop=lambda: job.cancel_requested), kind="weeks")
+
+    def project_lnf_playoffs(self, n_sims=5000):
+        return self.submit("Projeção dos Playoffs", lambda engine, job: engine.project_lnf_playoffs(n_sims),
+                           kind="projection")